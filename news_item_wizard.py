@@ -4,13 +4,25 @@
 from __future__ import annotations
 
 import argparse
+import bisect
+import hashlib
 import json
 import os
 import re
+import stat
 import sys
-from dataclasses import dataclass
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
 
 
 @dataclass
@@ -123,15 +135,24 @@ Return only the JSON object, nothing else.
         "response_mime_type": "application/json",
     }
 
-    response = model.generate_content(prompt, generation_config=generation_config)
+    try:
+        with METRICS.timer("wizard_model_request_duration_seconds"):
+            response = model.generate_content(prompt, generation_config=generation_config)
+    except Exception:
+        METRICS.inc("wizard_model_requests_total", outcome="error")
+        raise
 
     if not response or not getattr(response, "text", "").strip():
+        METRICS.inc("wizard_model_requests_total", outcome="empty")
         raise DraftError("No response received from Gemini.")
 
     try:
-        return json.loads(response.text)
+        draft = json.loads(response.text)
     except json.JSONDecodeError as exc:  # pragma: no cover - runtime guard
+        METRICS.inc("wizard_model_requests_total", outcome="invalid_json")
         raise DraftError(f"Gemini returned invalid JSON: {response.text}") from exc
+    METRICS.inc("wizard_model_requests_total", outcome="ok")
+    return draft
 
 
 def confirm(prompt: str) -> bool:
@@ -141,9 +162,15 @@ def confirm(prompt: str) -> bool:
 
 def repo_paths() -> Dict[str, Path]:
     root = Path(__file__).resolve().parent
-    news_dir = root / "public" / "content" / "news"
+    content_dir = root / "public" / "content"
+    news_dir = content_dir / "news"
     manifest_path = news_dir / "index.json"
-    return {"root": root, "news_dir": news_dir, "manifest": manifest_path}
+    return {
+        "root": root,
+        "content_dir": content_dir,
+        "news_dir": news_dir,
+        "manifest": manifest_path,
+    }
 
 
 def write_item(
@@ -167,13 +194,59 @@ def write_item(
                 f"{item_path} already exists. Retry with 'force' enabled to overwrite."
             )
 
-    with item_path.open("w", encoding="utf-8") as fh:
-        json.dump(data, fh, ensure_ascii=True, indent=2)
-        fh.write("\n")
-
+    atomic_write_json(item_path, data)
     return item_path
 
 
+def _current_umask() -> int:
+    # os.umask can only be read by setting it, so do it once at import.
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def atomic_write_json(path: Path, payload: Any) -> None:
+    """Write JSON to a sibling temp file and rename it over ``path``."""
+    rendered = json.dumps(payload, ensure_ascii=True, indent=2) + "\n"
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(rendered)
+            fh.flush()
+            os.fsync(fh.fileno())
+        # mkstemp creates the file 0600; keep the replaced file's mode, or
+        # use what open() would give a new file.
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = NEW_FILE_MODE
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``lock_path`` across processes."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a+") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
 def load_manifest(manifest_path: Path) -> Dict[str, Any]:
     if manifest_path.exists():
         with manifest_path.open("r", encoding="utf-8") as fh:
@@ -184,40 +257,472 @@ def load_manifest(manifest_path: Path) -> Dict[str, Any]:
     return {"items": []}
 
 
+def manifest_entry_slug(entry: Any) -> Optional[str]:
+    if isinstance(entry, str):
+        return entry
+    if isinstance(entry, dict) and isinstance(entry.get("base"), str):
+        return entry["base"]
+    return None
+
+
 def manifest_contains(items: List[Any], slug: str) -> bool:
-    for entry in items:
-        if isinstance(entry, str) and entry == slug:
-            return True
-        if isinstance(entry, dict) and entry.get("base") == slug:
+    return any(manifest_entry_slug(entry) == slug for entry in items)
+
+
+@dataclass
+class ManifestStore:
+    """Cached view of a manifest with a slug index and locked, atomic writes.
+
+    The parsed manifest and its slug → position index are kept in memory and
+    reloaded only when the file's mtime or size changes, so repeated saves in
+    a long-running server do not re-parse ``index.json`` each time. Writers
+    serialise on a lock file in the system temp directory (kept out of
+    ``public/`` so it never ships), which also covers other uvicorn workers.
+    """
+
+    path: Path
+    _manifest: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _stamp: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False)
+    _mutex: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def lock_path(self) -> Path:
+        digest = hashlib.sha1(str(self.path).encode("utf-8")).hexdigest()[:16]
+        return Path(tempfile.gettempdir()) / f"dtcc-manifest-{digest}.lock"
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self) -> None:
+        stamp = self._file_stamp()
+        if self._manifest and stamp == self._stamp:
+            METRICS.inc("wizard_cache_requests_total", cache="manifest", result="hit")
+            return
+        METRICS.inc("wizard_cache_requests_total", cache="manifest", result="miss")
+
+        manifest = load_manifest(self.path)
+        items = manifest.setdefault("items", [])
+        if not isinstance(items, list):
+            raise DraftError(f"Manifest {self.path} should contain a list under 'items'.")
+
+        index: Dict[str, int] = {}
+        for position, entry in enumerate(items):
+            slug = manifest_entry_slug(entry)
+            if slug is not None:
+                index.setdefault(slug, position)
+
+        self._manifest = manifest
+        self._index = index
+        self._stamp = stamp
+
+    def contains(self, slug: str) -> bool:
+        with self._mutex:
+            self._refresh()
+            return slug in self._index
+
+    def add(self, slug: str, image: Optional[str]) -> bool:
+        """Append ``slug`` unless present. Returns ``True`` when the file changed."""
+        with self._mutex, file_lock(self.lock_path):
+            self._refresh()
+            if slug in self._index:
+                return False
+
+            entry: Any = {"base": slug}
+            if image:
+                entry["image"] = image
+
+            items = self._manifest["items"]
+            items.append(entry)
+            try:
+                atomic_write_json(self.path, self._manifest)
+            except BaseException:
+                items.pop()
+                raise
+            self._index[slug] = len(items) - 1
+            self._stamp = self._file_stamp()
             return True
-    return False
+
+
+_MANIFEST_STORES: Dict[Path, ManifestStore] = {}
+_MANIFEST_STORES_LOCK = threading.Lock()
+
+
+def manifest_store(manifest_path: Path) -> ManifestStore:
+    key = manifest_path.resolve()
+    with _MANIFEST_STORES_LOCK:
+        store = _MANIFEST_STORES.get(key)
+        if store is None:
+            store = _MANIFEST_STORES[key] = ManifestStore(key)
+        return store
 
 
 def update_manifest(
     manifest_path: Path, slug: str, image: Optional[str], *, quiet: bool = False
 ) -> bool:
-    manifest = load_manifest(manifest_path)
-    items = manifest.setdefault("items", [])
+    changed = manifest_store(manifest_path).add(slug, image)
+    if not changed and not quiet:
+        print(f"Manifest already references '{slug}'. Skipping manifest update.")
+    return changed
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(key, value.replace("\\", "\\\\").replace('"', '\\"')) for key, value in labels
+    )
+    return "{" + rendered + "}"
+
+
+class Metrics:
+    """Minimal Prometheus text-format registry for the wizard service.
+
+    Counters, gauges and fixed-bucket histograms keyed by label tuples. Values
+    are per process; with several uvicorn workers each one reports its own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._values: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {}
+        self._histograms: Dict[str, Dict[Tuple[Tuple[str, str], ...], List[float]]] = {}
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        self._help[name] = (kind, help_text)
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            # Layout: one slot per bucket, then +Inf, sum, count.
+            slots = series.setdefault(key, [0.0] * (len(LATENCY_BUCKETS) + 3))
+            slots[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+            slots[-2] += value
+            slots[-1] += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(set(self._values) | set(self._histograms)):
+                kind, help_text = self._help.get(name, ("untyped", ""))
+                if help_text:
+                    lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in sorted(self._values.get(name, {}).items()):
+                    lines.append(f"{name}{_format_labels(labels)} {value:g}")
+                for labels, slots in sorted(self._histograms.get(name, {}).items()):
+                    cumulative = 0.0
+                    for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), slots):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative:g}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {slots[-2]:g}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {slots[-1]:g}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+METRICS.describe("wizard_http_requests_total", "counter", "HTTP requests by route, method and status.")
+METRICS.describe("wizard_http_request_duration_seconds", "histogram", "HTTP request latency by route.")
+METRICS.describe("wizard_http_requests_in_flight", "gauge", "HTTP requests currently being served.")
+METRICS.describe("wizard_model_request_duration_seconds", "histogram", "Gemini generate_content latency.")
+METRICS.describe("wizard_model_requests_total", "counter", "Gemini draft requests by outcome.")
+METRICS.describe("wizard_cache_requests_total", "counter", "Cache lookups by cache and result (hit/miss).")
+
+
+class SamplingProfiler:
+    """Time-bounded wall-clock sampler over every thread's Python stack.
+
+    Returns folded stacks (``frame;frame;frame count``) that flamegraph.pl,
+    speedscope and similar tools read directly.
+    """
+
+    def __init__(self, max_seconds: float = 30.0) -> None:
+        self.max_seconds = max_seconds
+        self._busy = threading.Lock()
+
+    def capture(self, seconds: float, interval: float = 0.005) -> str:
+        if not self._busy.acquire(blocking=False):
+            raise DraftError("A profile capture is already running.")
+        try:
+            seconds = min(max(seconds, 0.1), self.max_seconds)
+            interval = min(max(interval, 0.001), 1.0)
+            me = threading.get_ident()
+            stacks: Dict[str, int] = {}
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == me:
+                        continue
+                    names: List[str] = []
+                    while frame is not None:
+                        code = frame.f_code
+                        names.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                        frame = frame.f_back
+                    folded = ";".join(reversed(names))
+                    stacks[folded] = stacks.get(folded, 0) + 1
+                time.sleep(interval)
+        finally:
+            self._busy.release()
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+
+
+CONTENT_SECTIONS = ("news", "projects", "events", "dtcc-1", "gallery")
+DATE_FIELDS = ("date", "published", "publishedAt", "time", "updated")
+RE_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+@dataclass
+class ContentEntry:
+    slug: str
+    data: Dict[str, Any]
+    stamp: Tuple[int, int]
+
+    @property
+    def title(self) -> str:
+        return str(self.data.get("title") or self.data.get("name") or self.slug)
+
+    @property
+    def date(self) -> str:
+        for key in DATE_FIELDS:
+            value = self.data.get(key)
+            if value:
+                return str(value)[:10]
+        return ""
+
+    def summary(self) -> Dict[str, Any]:
+        return {"slug": self.slug, "title": self.title, "date": self.date or None, "data": self.data}
+
+
+@dataclass
+class _SectionIndex:
+    entries: Dict[str, ContentEntry] = field(default_factory=dict)
+    ordered: Optional[List[ContentEntry]] = None
+    terms: Optional[List[Tuple[str, str]]] = None
+    etag: Optional[str] = None
+
+
+class ContentIndex:
+    """In-memory index of ``public/content/<section>/*.json`` detail files.
+
+    Entries are parsed once and refreshed per file when the watcher reports a
+    change (or a poll notices a different mtime/size). Sorted views, the
+    prefix-search term list and the ETag are derived lazily and dropped on
+    every change to the section.
+    """
+
+    def __init__(self, content_root: Path, sections: Tuple[str, ...] = CONTENT_SECTIONS) -> None:
+        self.content_root = content_root
+        self.sections = sections
+        self._sections: Dict[str, _SectionIndex] = {name: _SectionIndex() for name in sections}
+        self._lock = threading.RLock()
+        for section in sections:
+            self.rescan(section)
+
+    def _section_for(self, path: Path) -> Optional[str]:
+        try:
+            relative = path.resolve().relative_to(self.content_root.resolve())
+        except ValueError:
+            return None
+        if len(relative.parts) != 2 or relative.suffix != ".json":
+            return None
+        section = relative.parts[0]
+        return section if section in self._sections else None
+
+    def _load(self, path: Path) -> Optional[ContentEntry]:
+        if path.name.startswith((".", "index.")):
+            return None
+        try:
+            stat = path.stat()
+            with path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        return ContentEntry(slug=path.stem, data=data, stamp=(stat.st_mtime_ns, stat.st_size))
+
+    def _invalidate(self, index: _SectionIndex) -> None:
+        index.ordered = None
+        index.terms = None
+        index.etag = None
+
+    def rescan(self, section: str) -> bool:
+        """Reload changed files in ``section``; returns ``True`` if anything changed."""
+        dir_path = self.content_root / section
+        with self._lock:
+            index = self._sections[section]
+            seen = set()
+            changed = False
+            for path in dir_path.glob("*.json") if dir_path.is_dir() else ():
+                if path.name.startswith((".", "index.")):
+                    continue
+                seen.add(path.stem)
+                current = index.entries.get(path.stem)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if current and current.stamp == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                entry = self._load(path)
+                if entry is not None:
+                    index.entries[entry.slug] = entry
+                    changed = True
+            for slug in set(index.entries) - seen:
+                del index.entries[slug]
+                changed = True
+            if changed:
+                self._invalidate(index)
+            return changed
+
+    def refresh_path(self, path: Path) -> None:
+        section = self._section_for(path)
+        if section is None or path.name.startswith("index."):
+            return
+        with self._lock:
+            index = self._sections[section]
+            entry = self._load(path) if path.exists() else None
+            if entry is not None:
+                index.entries[entry.slug] = entry
+            elif index.entries.pop(path.stem, None) is None:
+                return
+            self._invalidate(index)
+
+    def _ordered(self, section: str) -> Tuple[List[ContentEntry], str]:
+        with self._lock:
+            index = self._sections[section]
+            if index.ordered is None:
+                entries = sorted(index.entries.values(), key=lambda e: e.slug)
+                entries.sort(key=lambda e: e.date, reverse=True)
+                digest = hashlib.sha1()
+                for entry in entries:
+                    digest.update(f"{entry.slug}:{entry.stamp[0]}:{entry.stamp[1]};".encode("utf-8"))
+                index.ordered = entries
+                index.etag = f'W/"{section}-{digest.hexdigest()[:20]}"'
+            return index.ordered, index.etag or ""
+
+    def _terms(self, section: str) -> List[Tuple[str, str]]:
+        with self._lock:
+            index = self._sections[section]
+            if index.terms is None:
+                terms = set()
+                for entry in index.entries.values():
+                    terms.add((entry.slug, entry.slug))
+                    for token in RE_TOKEN.findall(entry.title.lower()):
+                        terms.add((token, entry.slug))
+                index.terms = sorted(terms)
+            return index.terms
+
+    def etag(self, section: str) -> str:
+        return self._ordered(section)[1]
+
+    def page(self, section: str, page: int, page_size: int) -> Dict[str, Any]:
+        entries, _ = self._ordered(section)
+        start = (page - 1) * page_size
+        return {
+            "section": section,
+            "page": page,
+            "pageSize": page_size,
+            "total": len(entries),
+            "items": [entry.summary() for entry in entries[start : start + page_size]],
+        }
+
+    def get(self, section: str, slug: str) -> Optional[ContentEntry]:
+        with self._lock:
+            return self._sections[section].entries.get(slug)
+
+    def search(self, section: str, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        terms = self._terms(section)
+        entries, _ = self._ordered(section)
+        rank = {entry.slug: position for position, entry in enumerate(entries)}
+
+        matched = set()
+        start = bisect.bisect_left(terms, (prefix, ""))
+        for term, slug in terms[start:]:
+            if not term.startswith(prefix):
+                break
+            matched.add(slug)
+
+        ordered = sorted(matched, key=lambda slug: rank.get(slug, len(rank)))[:limit]
+        with self._lock:
+            entries_by_slug = self._sections[section].entries
+            return [entries_by_slug[slug].summary() for slug in ordered if slug in entries_by_slug]
+
+
+def watch_content(index: ContentIndex, *, interval: float = 2.0) -> Callable[[], None]:
+    """Keep ``index`` current; returns a callable that stops watching.
+
+    Uses watchdog (inotify/FSEvents) when installed and falls back to
+    polling every ``interval`` seconds otherwise.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        Observer = None  # type: ignore[assignment]
+
+    if Observer is not None:
 
-    if not isinstance(items, list):
-        raise DraftError(f"Manifest {manifest_path} should contain a list under 'items'.")
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):  # type: ignore[override]
+                if event.is_directory:
+                    return
+                for attr in ("src_path", "dest_path"):
+                    value = getattr(event, attr, None)
+                    if value:
+                        index.refresh_path(Path(os.fsdecode(value)))
 
-    if manifest_contains(items, slug):
-        if not quiet:
-            print(f"Manifest already references '{slug}'. Skipping manifest update.")
-        return False
+        observer = Observer()
+        handler = _Handler()
+        for section in index.sections:
+            dir_path = index.content_root / section
+            if dir_path.is_dir():
+                observer.schedule(handler, str(dir_path), recursive=False)
+        observer.daemon = True
+        observer.start()
 
-    entry: Any = {"base": slug}
-    if image:
-        entry["image"] = image
+        def stop_observer() -> None:
+            observer.stop()
+            observer.join(timeout=5)
 
-    items.append(entry)
+        return stop_observer
 
-    with manifest_path.open("w", encoding="utf-8") as fh:
-        json.dump(manifest, fh, ensure_ascii=True, indent=2)
-        fh.write("\n")
+    stop = threading.Event()
 
-    return True
+    def poll() -> None:
+        while not stop.wait(interval):
+            for section in index.sections:
+                index.rescan(section)
+
+    thread = threading.Thread(target=poll, name="content-index-poll", daemon=True)
+    thread.start()
+    return stop.set
 
 
 def run_cli() -> None:
@@ -266,8 +771,9 @@ def run_cli() -> None:
 
 def create_service(model: Any):  # pragma: no cover - HTTP server helper
     try:
-        from fastapi import FastAPI, HTTPException
+        from fastapi import FastAPI, HTTPException, Query, Request
         from fastapi.middleware.cors import CORSMiddleware
+        from fastapi.responses import JSONResponse, PlainTextResponse, Response
         from pydantic import BaseModel, Field, validator
     except ImportError as exc:
         raise DraftError(
@@ -275,6 +781,7 @@ def create_service(model: Any):  # pragma: no cover - HTTP server helper
         ) from exc
 
     paths = repo_paths()
+    content_index = ContentIndex(paths["content_dir"])
 
     app = FastAPI(title="DTCC News Wizard", version="0.1.0")
     app.add_middleware(
@@ -284,6 +791,29 @@ def create_service(model: Any):  # pragma: no cover - HTTP server helper
         allow_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def record_metrics(request: Request, call_next):
+        METRICS.inc("wizard_http_requests_in_flight")
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            METRICS.inc("wizard_http_requests_in_flight", -1)
+            METRICS.observe(
+                "wizard_http_request_duration_seconds", time.perf_counter() - start, route=path
+            )
+            METRICS.inc(
+                "wizard_http_requests_total",
+                route=path,
+                method=request.method,
+                status=str(status),
+            )
+
     class DraftPayload(BaseModel):
         title: str
         bullets: List[str]
@@ -353,6 +883,7 @@ def create_service(model: Any):  # pragma: no cover - HTTP server helper
             update_manifest(paths["manifest"], payload.slug, image, quiet=True)
         except DraftError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
+        content_index.refresh_path(item_path)
 
         return {
             "itemPath": str(item_path.relative_to(paths["root"])),
@@ -363,6 +894,86 @@ def create_service(model: Any):  # pragma: no cover - HTTP server helper
     def healthcheck():
         return {"status": "ok", "newsDir": str(paths["news_dir"]) }
 
+    def require_section(section: str) -> str:
+        if section not in content_index.sections:
+            raise HTTPException(status_code=404, detail=f"Unknown section '{section}'")
+        return section
+
+    def cached_json(request: Request, etag: str, build: Callable[[], Any]) -> Response:
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            METRICS.inc("wizard_cache_requests_total", cache="content_etag", result="hit")
+            return Response(status_code=304, headers=headers)
+        METRICS.inc("wizard_cache_requests_total", cache="content_etag", result="miss")
+        return JSONResponse(build(), headers=headers)
+
+    @app.get("/api/content/{section}")
+    def list_content(
+        request: Request,
+        section: str,
+        page: int = Query(1, ge=1),
+        page_size: int = Query(50, ge=1, le=500, alias="pageSize"),
+    ):
+        require_section(section)
+        return cached_json(
+            request,
+            content_index.etag(section),
+            lambda: content_index.page(section, page, page_size),
+        )
+
+    # Not under /api/content/{section}/, where it would shadow a "search" slug.
+    @app.get("/api/search/{section}")
+    def search_content(
+        request: Request,
+        section: str,
+        q: str = Query(..., min_length=1),
+        limit: int = Query(20, ge=1, le=200),
+    ):
+        require_section(section)
+        return cached_json(
+            request,
+            content_index.etag(section),
+            lambda: {"section": section, "query": q, "items": content_index.search(section, q, limit)},
+        )
+
+    @app.get("/api/content/{section}/{slug}")
+    def get_content(request: Request, section: str, slug: str):
+        require_section(section)
+        entry = content_index.get(section, slug)
+        if entry is None:
+            raise HTTPException(status_code=404, detail=f"No {section} entry '{slug}'")
+        etag = f'W/"{section}-{slug}-{entry.stamp[0]}-{entry.stamp[1]}"'
+        return cached_json(request, etag, entry.summary)
+
+    @app.get("/metrics")
+    def metrics():
+        return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
+
+    if os.environ.get("NEWS_WIZARD_PROFILER", "").lower() in {"1", "true", "yes"}:
+        profiler = SamplingProfiler()
+
+        @app.get("/debug/profile")
+        def profile(
+            seconds: float = Query(5.0, gt=0, le=profiler.max_seconds),
+            interval: float = Query(0.005, gt=0, le=1.0),
+        ):
+            try:
+                folded = profiler.capture(seconds, interval)
+            except DraftError as exc:
+                raise HTTPException(status_code=409, detail=str(exc)) from exc
+            return PlainTextResponse(folded)
+
+    stop_watching: List[Callable[[], None]] = []
+
+    @app.on_event("startup")
+    def start_content_watch() -> None:
+        stop_watching.append(watch_content(content_index))
+
+    @app.on_event("shutdown")
+    def stop_content_watch() -> None:
+        while stop_watching:
+            stop_watching.pop()()
+
     return app
 
 
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the content build scripts on synthetic sections.
+
+Each benchmark builds a throwaway content tree in a temp directory, so the
+real `public/content` is never touched:
+
+    python3 scripts/benchmark_content.py manifest-cache --items 10000
+    python3 scripts/benchmark_content.py parallel-load --items 1000 10000 50000
+    python3 scripts/benchmark_content.py search-index --items 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import build_search_index as search_tool  # noqa: E402
+import update_news_projects_manifest as manifest_tool  # noqa: E402
+
+
+WORDS = (
+    "digital twin city urban model data platform simulation climate energy "
+    "mobility construction building tree wind noise sensor planning design "
+    "circular reuse workshop seminar research partner open source"
+).split()
+
+
+def synthetic_document(rng: random.Random, index: int) -> Dict[str, object]:
+    day = date(2020, 1, 1) + timedelta(days=rng.randrange(0, 2500))
+    title = " ".join(rng.choice(WORDS) for _ in range(6)).capitalize()
+    body = " ".join(rng.choice(WORDS) for _ in range(rng.randrange(80, 400)))
+    return {
+        "title": f"{title} {index}",
+        "summary": " ".join(rng.choice(WORDS) for _ in range(30)),
+        "body": body,
+        "date": day.isoformat(),
+        "image": f"content/news/item-{index:06d}.webp",
+        "tags": rng.sample(WORDS, 3),
+    }
+
+
+def write_section(root: Path, section: str, count: int, seed: int = 7) -> Path:
+    rng = random.Random(seed)
+    dir_path = root / section
+    dir_path.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        payload = synthetic_document(rng, index)
+        (dir_path / f"item-{index:06d}.json").write_text(
+            json.dumps(payload, indent=2), encoding="utf-8"
+        )
+    return dir_path
+
+
+def synthetic_vocabulary(rng: random.Random, size: int) -> List[str]:
+    """Pronounceable pseudo-words, so term shards fill like real prose."""
+    onsets = "b c d f g h k l m n p r s t v"
+    vowels = "a e i o u"
+    syllables = [o + v for o in onsets.split() for v in vowels.split()]
+    words = set(WORDS)
+    while len(words) < size:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randrange(2, 5))))
+    return sorted(words)
+
+
+def write_search_corpus(root: Path, count: int, vocabulary: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    vocab = synthetic_vocabulary(rng, vocabulary)
+    # Zipf-like weights: a few very common words and a long tail.
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    rng.shuffle(vocab)
+    sections = search_tool.SEARCH_SECTIONS
+    for section in sections:
+        (root / manifest_tool.SECTION_SETTINGS[section]["dir"]).mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        section = sections[index % len(sections)]
+        words = rng.choices(vocab, weights, k=rng.randrange(80, 400))
+        payload = synthetic_document(rng, index)
+        payload.update(
+            title=" ".join(words[:6]).capitalize(),
+            summary=" ".join(words[6:36]),
+            body=" ".join(words[36:]),
+        )
+        dir_path = root / manifest_tool.SECTION_SETTINGS[section]["dir"]
+        (dir_path / f"item-{index:06d}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+def timed(fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    return time.perf_counter() - start
+
+
+def bench_manifest_cache(sizes: List[int]) -> None:
+    print(f"{'items':>8} {'cold (s)':>10} {'warm (s)':>10} {'1 edit (s)':>11}")
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            dir_path = write_section(root, "news", count)
+            cache = manifest_tool.load_cache(root / "cache.json")
+
+            def run() -> None:
+                manifest_tool.update_section("news", content_root=root, cache=cache)
+
+            cold = timed(run)
+            warm = timed(run)
+            edited = dir_path / "item-000000.json"
+            edited.write_text(edited.read_text(encoding="utf-8").replace("item", "edited", 1))
+            one_edit = timed(run)
+        print(f"{count:>8} {cold:>10.3f} {warm:>10.3f} {one_edit:>11.3f}")
+
+
+def bench_parallel_load(sizes: List[int], jobs: int) -> None:
+    fast = manifest_tool.orjson
+    variants = [("stdlib, 1 job", None, 1)]
+    if fast is not None:
+        variants.append(("orjson, 1 job", fast, 1))
+    variants.append((f"{'orjson' if fast else 'stdlib'}, {jobs} jobs", fast, jobs))
+
+    header = "".join(f"{label:>20}" for label, _, _ in variants)
+    print(f"{'files':>8}{header}")
+    for count in sizes:
+        timings = []
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_section(root, "news", count)
+            for _, decoder, worker_count in variants:
+                manifest_tool.orjson = decoder
+                timings.append(
+                    timed(
+                        lambda: manifest_tool.update_section(
+                            "news", content_root=root, full=True, jobs=worker_count
+                        )
+                    )
+                )
+        manifest_tool.orjson = fast
+        print(f"{count:>8}" + "".join(f"{seconds:>19.3f}s" for seconds in timings))
+
+
+def bench_search_index(sizes: List[int], vocabulary: int, jobs: int) -> None:
+    print(
+        f"{'docs':>8} {'terms':>8} {'collect (s)':>12} {'build (s)':>10} {'write (s)':>10} "
+        f"{'shards':>7} {'total KiB':>10} {'median B':>9} {'max KiB':>8}"
+    )
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_search_corpus(root, count, vocabulary)
+
+            start = time.perf_counter()
+            docs = search_tool.collect_docs(root, jobs)
+            collected = time.perf_counter()
+            files = search_tool.build_index(docs)
+            built = time.perf_counter()
+            _, sizes_by_name = search_tool.write_index(root / "search", files)
+            written = time.perf_counter()
+
+        shard_sizes = sorted(size for name, size in sizes_by_name.items() if name.startswith("terms-"))
+        median = shard_sizes[len(shard_sizes) // 2] if shard_sizes else 0
+        print(
+            f"{count:>8} {files['index.json']['totalTerms']:>8} {collected - start:>12.3f} "
+            f"{built - collected:>10.3f} {written - built:>10.3f} {len(shard_sizes):>7} "
+            f"{sum(shard_sizes) / 1024:>10.1f} {median:>9} {max(shard_sizes, default=0) / 1024:>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+
+    cache_parser = sub.add_parser("manifest-cache", help="Cold vs warm manifest regeneration")
+    cache_parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000])
+
+    load_parser = sub.add_parser("parallel-load", help="Sequential vs pooled cold parsing")
+    load_parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000, 50000])
+    load_parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+
+    search_parser = sub.add_parser("search-index", help="Search index build time and shard sizes")
+    search_parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000, 50000])
+    search_parser.add_argument("--vocabulary", type=int, default=20000)
+    search_parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+
+    args = parser.parse_args()
+    if args.benchmark == "manifest-cache":
+        bench_manifest_cache(args.items)
+    elif args.benchmark == "parallel-load":
+        bench_parallel_load(args.items, args.jobs)
+    elif args.benchmark == "search-index":
+        bench_search_index(args.items, args.vocabulary, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
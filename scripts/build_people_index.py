@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Build per-person reverse indexes under `public/content/people/`.
+
+Every user in `content/users.json` gets `people/<slug>.json` listing the
+news, projects, dtcc-1 items and events that name them, and the papers
+(from `public/content/papers/store.json`) they authored:
+
+    {
+      "user": {...},                       # the users.json record
+      "news": [card, ...],                 # newest first
+      "projects": [...], "dtcc-1": [...], "events": [...],
+      "papers": [paper, ...]               # newest first
+    }
+
+`people/index.json` lists every person with per-kind counts, so a people
+page or author filter needs one small fetch.
+
+Content items name people in `contacts` (and `speakers`/`organizers` when
+present) by user slug or by name. Paper authors are free-text strings in
+`author_name` and `additional_authors`, written as "Anders Logg", "A. Logg",
+"Logg, Anders" or "L Thuvander". Names are compared after `normalize_name`
+(accents, case and punctuation removed, "Last, First" flipped); a full-name
+match wins. An abbreviated given name ("A. Logg", "A Logg") falls back to
+the first initial plus surname when exactly one user has it; a different
+full given name ("Anna Logg") never does. The files are build outputs and are not committed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from build_resolved_content import card_summary, load_section, load_users  # noqa: E402
+from paper_store import load_papers, normalize_name  # noqa: E402
+from update_news_projects_manifest import CONTENT_ROOT, write_if_changed  # noqa: E402
+
+
+PEOPLE_DIR = "people"
+CONTENT_KINDS = ("news", "projects", "dtcc-1", "events")
+PEOPLE_FIELDS = ("contacts", "speakers", "organizers")
+PAPER_FIELDS = ("id", "doi", "title", "journal", "date", "url", "publication_type")
+# `people/index.json` is the person list, so no user file may take its name.
+RESERVED_SLUGS = frozenset({"index"})
+
+
+def initial_key(normalized: str) -> Optional[str]:
+    """First initial plus surname (`"a logg"`), or None for a single word."""
+    parts = normalized.split()
+    if len(parts) < 2:
+        return None
+    return f"{parts[0][0]} {parts[-1]}"
+
+
+class PersonMatcher:
+    """Resolve user slugs and free-text names to user slugs."""
+
+    def __init__(self, users: Dict[str, Dict[str, Any]]) -> None:
+        self.users = users
+        self._full: Dict[str, str] = {}
+        initials: Dict[str, List[str]] = {}
+        for slug, record in users.items():
+            name = record.get("name") or record.get("displayName")
+            if not isinstance(name, str) or not name.strip():
+                continue
+            normalized = normalize_name(name)
+            self._full[normalized] = slug
+            key = initial_key(normalized)
+            if key:
+                initials.setdefault(key, []).append(slug)
+        # Ambiguous initials ("a. smith" with two A. Smiths) match nobody.
+        self._initials = {key: slugs[0] for key, slugs in initials.items() if len(slugs) == 1}
+
+    def match(self, value: Any) -> Optional[str]:
+        if not isinstance(value, str) or not value.strip():
+            return None
+        if value in self.users:
+            return value
+        normalized = normalize_name(value)
+        if normalized in self._full:
+            return self._full[normalized]
+        # Only an initial may stand for a given name: "Anna Logg" is not Anders.
+        given = normalized.split()[:1]
+        if not given or len(given[0]) != 1:
+            return None
+        key = initial_key(normalized)
+        return self._initials.get(key) if key else None
+
+
+def paper_summary(paper: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: paper.get(field) for field in PAPER_FIELDS if paper.get(field) not in (None, "")}
+
+
+def _newest_first(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(entries, key=lambda entry: (entry.get("date") or "", entry.get("title") or ""), reverse=True)
+
+
+def collect_people(content_root: Path) -> Dict[str, Any]:
+    """Return ``{filename: payload}`` for the people directory."""
+    users = load_users(content_root)
+    for slug in RESERVED_SLUGS & users.keys():
+        print(f"[people] Skipped user '{slug}': the slug is reserved for {PEOPLE_DIR}/{slug}.json")
+        del users[slug]
+    matcher = PersonMatcher(users)
+    people: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+        slug: {kind: [] for kind in (*CONTENT_KINDS, "papers")} for slug in users
+    }
+
+    for kind in CONTENT_KINDS:
+        for slug, payload in load_section(content_root, kind).items():
+            named = {
+                matcher.match(value)
+                for field in PEOPLE_FIELDS
+                for value in (payload.get(field) if isinstance(payload.get(field), list) else [])
+            }
+            card = {"slug": slug, **card_summary(payload), "date": payload.get("date")}
+            for person in named - {None}:
+                people[person][kind].append(card)
+
+    unmatched = 0
+    records, _ = load_papers(content_root / "papers")
+    for paper in records.values():
+        authors = [paper.get("author_name"), *(paper.get("additional_authors") or [])]
+        matched = set()
+        for author in authors:
+            person = matcher.match(author)
+            if person:
+                matched.add(person)
+            elif isinstance(author, str) and author.strip():
+                unmatched += 1
+        for person in matched:
+            people[person]["papers"].append(paper_summary(paper))
+
+    files: Dict[str, Any] = {}
+    index: List[Dict[str, Any]] = []
+    for slug, kinds in people.items():
+        record = users[slug]
+        files[f"{slug}.json"] = {"user": record, **{kind: _newest_first(items) for kind, items in kinds.items()}}
+        index.append(
+            {
+                "slug": slug,
+                "name": record.get("name") or record.get("displayName") or slug,
+                "counts": {kind: len(items) for kind, items in kinds.items()},
+            }
+        )
+    files["index.json"] = {"people": index, "unmatchedAuthorMentions": unmatched}
+    return files
+
+
+def write_people(out_dir: Path, files: Dict[str, Any]) -> int:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for name, payload in files.items():
+        rendered = json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+        written += write_if_changed(out_dir / name, rendered)
+    for stale in out_dir.glob("*.json"):
+        if stale.name not in files:
+            stale.unlink()
+            written += 1
+    return written
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build per-person reverse indexes.")
+    parser.parse_args(argv)
+
+    started = time.perf_counter()
+    files = collect_people(CONTENT_ROOT)
+    written = write_people(CONTENT_ROOT / PEOPLE_DIR, files)
+    elapsed = time.perf_counter() - started
+
+    index = files["index.json"]
+    papers = sum(person["counts"]["papers"] for person in index["people"])
+    print(
+        f"[people] {len(index['people'])} people, {papers} paper links "
+        f"({index['unmatchedAuthorMentions']} author mentions without a user), "
+        f"{written} file(s) rewritten in {elapsed:.3f}s."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Write a resolved companion file for every news, projects and dtcc-1 item.
+
+Detail pages used to fetch the item, then each `related`/`relatedProjects`
+entry, then the whole `content/users.json`, one round trip after another.
+`public/content/<section>/resolved/<slug>.json` holds all of it:
+
+    {
+      "item": {...},                       # the item JSON, unchanged
+      "refs": {"news": {"<slug>": card}},  # card summaries, null if missing
+      "users": [...],                      # only the users in `contacts`
+      "papers": [...]                      # dtcc-1 only: papers/<slug>.json records
+    }
+
+A card is `{"title", "summary", "image"}`, which is all the related tiles
+read. The files are build outputs: CI runs this before `npm run build` and
+the `resolved/` directories are not committed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from paper_store import milestone_papers  # noqa: E402
+from update_news_projects_manifest import (  # noqa: E402
+    CONTENT_ROOT,
+    SECTION_SETTINGS,
+    is_content_file,
+    read_payload,
+    write_if_changed,
+)
+
+
+RESOLVED_DIR = "resolved"
+# Item field -> section its slugs point into, per detail section.
+REFERENCE_FIELDS: Dict[str, Dict[str, str]] = {
+    "news": {"related": "news", "relatedProjects": "projects"},
+    "projects": {"related": "projects"},
+    "dtcc-1": {"related": "dtcc-1"},
+}
+# Sections whose detail page also shows `papers/<slug>.json`.
+PAPER_SECTIONS = ("dtcc-1",)
+USER_KEYS = ("slug", "id", "username", "email")
+
+
+def card_summary(payload: Dict[str, Any]) -> Dict[str, Any]:
+    images = payload.get("images")
+    return {
+        "title": payload.get("title") or payload.get("name"),
+        "summary": payload.get("summary") or payload.get("excerpt") or payload.get("description") or "",
+        "image": payload.get("image") or (images[0] if isinstance(images, list) and images else None),
+    }
+
+
+def load_section(content_root: Path, section: str) -> Dict[str, Dict[str, Any]]:
+    dir_path = content_root / SECTION_SETTINGS[section]["dir"]
+    items: Dict[str, Dict[str, Any]] = {}
+    if not dir_path.is_dir():
+        return items
+    for path in sorted(dir_path.glob("*.json")):
+        if not is_content_file(path.name):
+            continue
+        try:
+            payload = read_payload(str(path))
+        except (OSError, ValueError) as exc:
+            print(f"[resolve] Skipping {path}: {exc}")
+            continue
+        if isinstance(payload, dict):
+            items[path.stem] = payload
+    return items
+
+
+def load_users(content_root: Path) -> Dict[str, Dict[str, Any]]:
+    """Index `users.json` records by the same keys the detail pages use."""
+    path = content_root / "users.json"
+    if not path.exists():
+        return {}
+    payload = read_payload(str(path))
+    records = payload.get("users", []) if isinstance(payload, dict) else payload
+    users: Dict[str, Dict[str, Any]] = {}
+    for record in records if isinstance(records, list) else []:
+        if not isinstance(record, dict):
+            continue
+        key = next((record[k] for k in USER_KEYS if record.get(k)), None)
+        if key:
+            users[key] = record
+    return users
+
+
+def _slugs(value: Any) -> List[str]:
+    if not isinstance(value, list):
+        return []
+    return [slug for slug in value if isinstance(slug, str) and slug]
+
+
+def resolve_item(
+    section: str,
+    slug: str,
+    payload: Dict[str, Any],
+    sections: Dict[str, Dict[str, Dict[str, Any]]],
+    users: Dict[str, Dict[str, Any]],
+    content_root: Path,
+) -> Dict[str, Any]:
+    refs: Dict[str, Dict[str, Any]] = {}
+    for field, target in REFERENCE_FIELDS[section].items():
+        for ref in _slugs(payload.get(field)):
+            found = sections[target].get(ref)
+            refs.setdefault(target, {})[ref] = card_summary(found) if found else None
+
+    resolved: Dict[str, Any] = {
+        "item": payload,
+        "refs": refs,
+        "users": [users[key] for key in _slugs(payload.get("contacts")) if key in users],
+    }
+    if section in PAPER_SECTIONS:
+        resolved["papers"] = milestone_papers(content_root / "papers", slug)
+    return resolved
+
+
+def build_resolved(content_root: Path = CONTENT_ROOT) -> Dict[str, int]:
+    """Write every companion file; returns rewritten file counts per section."""
+    sections = {
+        name: load_section(content_root, name)
+        for name in {*REFERENCE_FIELDS, *(t for refs in REFERENCE_FIELDS.values() for t in refs.values())}
+    }
+    users = load_users(content_root)
+    written: Dict[str, int] = {}
+    for section in REFERENCE_FIELDS:
+        out_dir = content_root / SECTION_SETTINGS[section]["dir"] / RESOLVED_DIR
+        out_dir.mkdir(parents=True, exist_ok=True)
+        count = 0
+        for slug, payload in sections[section].items():
+            resolved = resolve_item(section, slug, payload, sections, users, content_root)
+            rendered = json.dumps(resolved, ensure_ascii=False, separators=(",", ":")) + "\n"
+            count += write_if_changed(out_dir / f"{slug}.json", rendered)
+        for stale in out_dir.glob("*.json"):
+            if stale.stem not in sections[section]:
+                stale.unlink()
+                count += 1
+        written[section] = count
+    return written
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Write resolved companion files for detail pages.")
+    parser.parse_args(argv)
+
+    started = time.perf_counter()
+    written = build_resolved()
+    elapsed = time.perf_counter() - started
+    for section, count in written.items():
+        print(f"[{section}] Rewrote {count} resolved file(s).")
+    print(f"[resolve] Done in {elapsed:.3f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Build a static, sharded search index for the site under `public/content/search/`.
+
+News, projects, events and dtcc-1 entries are tokenized from their title,
+tags, summary and body; papers from `public/content/papers/store.json` from
+title, journal, publication type and authors. The output is:
+
+- `index.json`: the head file. It lists the term shard prefixes, the doc
+  shards and the tokenizer settings a client must mirror.
+- `terms-<prefix>.json`: the terms that start with `prefix`, in sorted
+  order. Each posting list is flat `[doc delta, score, doc delta, score, ...]`
+  with doc ids ascending and stored as gaps from the previous id.
+- `docs-<n>.json`: `[section, slug, title, url, date]` rows for doc ids
+  `n * docShardSize` and up.
+
+Prefixes are two characters, extended one character at a time (up to
+four) for any shard larger than `SHARD_TARGET_BYTES`, so a big corpus does
+not produce a few huge shards. A query normalises each word like the
+tokenizer, fetches the longest listed prefix of the word plus any listed
+shards that extend the word, and takes each term there that starts with
+the word.
+
+The index is a build artifact: CI runs this script before `npm run build`
+and `public/content/search/` is not committed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from paper_store import load_papers  # noqa: E402
+from update_news_projects_manifest import (  # noqa: E402
+    CONTENT_ROOT,
+    DEFAULT_JOBS,
+    SECTION_SETTINGS,
+    is_content_file,
+    map_files,
+    parse_date,
+    read_payload,
+    write_if_changed,
+)
+
+
+INDEX_VERSION = 1
+SEARCH_SECTIONS = ("news", "projects", "events", "dtcc-1")
+SHARD_PREFIX = 2
+MAX_SHARD_PREFIX = 4
+# Shards whose encoded size passes this are split on a longer prefix.
+SHARD_TARGET_BYTES = 64 * 1024
+DOC_SHARD_SIZE = 2000
+MIN_TOKEN = 2
+MAX_TOKEN = 32
+# Per-field weight; a term's score sums weight x min(count, FIELD_COUNT_CAP).
+FIELD_WEIGHTS = {"title": 8, "tags": 4, "summary": 2, "meta": 2, "body": 1}
+FIELD_COUNT_CAP = 3
+DETAIL_PAGES = {
+    "news": "news/detail.html",
+    "projects": "projects/detail.html",
+    "events": "events/detail.html",
+    "dtcc-1": "dtcc-1/detail.html",
+}
+STOPWORDS = frozenset(
+    """
+    an and are as at be by for from has have in is it its of on or that the this
+    to was were will with we our you your their they not but can also into than
+    """.split()
+)
+
+RE_TOKEN = re.compile(r"[a-z0-9]+")
+
+Doc = Tuple[str, str, str, str, Optional[str]]
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and strip accents (`Göteborg` -> `goteborg`)."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    # Bare numbers other than years are mostly DOI and page fragments.
+    return [
+        token
+        for token in RE_TOKEN.findall(normalize_text(text))
+        if MIN_TOKEN <= len(token) <= MAX_TOKEN
+        and token not in STOPWORDS
+        and (not token.isdigit() or len(token) == 4)
+    ]
+
+
+def _join(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return " ".join(item for item in value if isinstance(item, str))
+    return ""
+
+
+def content_fields(payload: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "title": _join(payload.get("title") or payload.get("name")),
+        "tags": _join(payload.get("tags")),
+        "summary": " ".join(
+            _join(payload.get(key)) for key in ("summary", "excerpt", "abstract", "description")
+        ),
+        "body": _join(payload.get("body")),
+    }
+
+
+def paper_fields(paper: Dict[str, Any]) -> Dict[str, str]:
+    authors = [paper.get("author_name")] + list(paper.get("additional_authors") or [])
+    return {
+        "title": _join(paper.get("title")),
+        "summary": _join([a for a in authors if isinstance(a, str)]),
+        "meta": " ".join(
+            _join(paper.get(key)) for key in ("journal", "publication_type")
+        ),
+    }
+
+
+def score_terms(fields: Dict[str, str]) -> Dict[str, int]:
+    scores: Dict[str, int] = {}
+    for field, text in fields.items():
+        if not text:
+            continue
+        counts: Dict[str, int] = defaultdict(int)
+        for token in tokenize(text):
+            counts[token] += 1
+        weight = FIELD_WEIGHTS[field]
+        for token, count in counts.items():
+            scores[token] = scores.get(token, 0) + weight * min(count, FIELD_COUNT_CAP)
+    return scores
+
+
+def read_content_doc(path: str, section: str) -> Tuple[Doc, Dict[str, int]]:
+    payload = read_payload(path)
+    slug = Path(path).stem
+    title = _join(payload.get("title") or payload.get("name")) or slug
+    url = payload.get("url") if isinstance(payload.get("url"), str) else None
+    if not url:
+        url = f"/{DETAIL_PAGES[section]}?slug={slug}"
+    record_date = parse_date(payload, SECTION_SETTINGS[section]["date_fields"])
+    doc = (section, slug, title, url, record_date.isoformat() if record_date else None)
+    return doc, score_terms(content_fields(payload))
+
+
+def collect_content_docs(content_root: Path, jobs: int) -> List[Tuple[Doc, Dict[str, int]]]:
+    paths: List[str] = []
+    sections: List[str] = []
+    for section in SEARCH_SECTIONS:
+        dir_path = content_root / SECTION_SETTINGS[section]["dir"]
+        if not dir_path.is_dir():
+            continue
+        for path in sorted(dir_path.glob("*.json")):
+            if is_content_file(path.name):
+                paths.append(str(path))
+                sections.append(section)
+    return map_files(read_content_doc, jobs, paths, sections)
+
+
+def collect_paper_docs(content_root: Path) -> List[Tuple[Doc, Dict[str, int]]]:
+    records, _ = load_papers(content_root / "papers")
+    docs: List[Tuple[Doc, Dict[str, int]]] = []
+    for key, paper in sorted(records.items()):
+        url = paper.get("url") or (f"https://doi.org/{paper['doi']}" if paper.get("doi") else "")
+        doc = ("papers", key, _join(paper.get("title")), url, paper.get("date") or None)
+        docs.append((doc, score_terms(paper_fields(paper))))
+    return docs
+
+
+def _encoded_size(term: str, flat: List[int]) -> int:
+    # `"term":[1,2,...],` in compact JSON.
+    return len(term) + 6 + sum(len(str(value)) + 1 for value in flat)
+
+
+def shard_terms(
+    encoded: Dict[str, List[int]],
+    *,
+    target_bytes: int = SHARD_TARGET_BYTES,
+) -> Dict[str, Dict[str, List[int]]]:
+    """Group sorted terms by prefix, lengthening prefixes of oversized groups."""
+    shards: Dict[str, Dict[str, List[int]]] = {}
+    pending: List[Tuple[str, List[str]]] = []
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for term in encoded:
+        groups[term[:SHARD_PREFIX]].append(term)
+    pending.extend(groups.items())
+    while pending:
+        prefix, terms = pending.pop()
+        size = sum(_encoded_size(term, encoded[term]) for term in terms)
+        if size <= target_bytes or len(prefix) >= MAX_SHARD_PREFIX:
+            shards[prefix] = {term: encoded[term] for term in terms}
+            continue
+        # Terms equal to the prefix itself stay with the shorter shard.
+        exact = [term for term in terms if len(term) == len(prefix)]
+        if exact:
+            shards[prefix] = {term: encoded[term] for term in exact}
+        longer: Dict[str, List[str]] = defaultdict(list)
+        for term in terms:
+            if len(term) > len(prefix):
+                longer[term[: len(prefix) + 1]].append(term)
+        pending.extend(longer.items())
+    return dict(sorted(shards.items()))
+
+
+def build_index(
+    docs: Sequence[Tuple[Doc, Dict[str, int]]],
+    *,
+    doc_shard_size: int = DOC_SHARD_SIZE,
+) -> Dict[str, Any]:
+    """Return ``{filename: payload}`` for every file of the index."""
+    postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for doc_id, (_, scores) in enumerate(docs):
+        for term, score in scores.items():
+            postings[term].append((doc_id, score))
+
+    encoded: Dict[str, List[int]] = {}
+    for term in sorted(postings):
+        flat: List[int] = []
+        previous = 0
+        for doc_id, score in postings[term]:
+            flat.extend((doc_id - previous, score))
+            previous = doc_id
+        encoded[term] = flat
+    shards = shard_terms(encoded)
+
+    files: Dict[str, Any] = {}
+    for prefix, terms in sorted(shards.items()):
+        files[f"terms-{prefix}.json"] = {"terms": terms}
+
+    doc_files: List[str] = []
+    for start in range(0, len(docs), doc_shard_size):
+        name = f"docs-{start // doc_shard_size}.json"
+        doc_files.append(name)
+        files[name] = {"docs": [list(doc) for doc, _ in docs[start : start + doc_shard_size]]}
+
+    files["index.json"] = {
+        "version": INDEX_VERSION,
+        "totalDocs": len(docs),
+        "totalTerms": len(postings),
+        "shardPrefixLength": SHARD_PREFIX,
+        "maxShardPrefixLength": MAX_SHARD_PREFIX,
+        "minTokenLength": MIN_TOKEN,
+        "stopwords": sorted(STOPWORDS),
+        "docShardSize": doc_shard_size,
+        "docFields": ["section", "slug", "title", "url", "date"],
+        "termShards": sorted(shards),
+        "docShards": doc_files,
+    }
+    return files
+
+
+def write_index(out_dir: Path, files: Dict[str, Any]) -> Tuple[int, Dict[str, int]]:
+    """Write changed files and drop stale shards; returns (rewritten, sizes)."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    sizes: Dict[str, int] = {}
+    for name, payload in files.items():
+        rendered = json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+        sizes[name] = len(rendered.encode("utf-8"))
+        written += write_if_changed(out_dir / name, rendered)
+    for stale in list(out_dir.glob("terms-*.json")) + list(out_dir.glob("docs-*.json")):
+        if stale.name not in files:
+            stale.unlink()
+            written += 1
+    return written, sizes
+
+
+def collect_docs(content_root: Path, jobs: int) -> List[Tuple[Doc, Dict[str, int]]]:
+    return collect_content_docs(content_root, jobs) + collect_paper_docs(content_root)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the static site search index.")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Worker processes for reading content")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    docs = collect_docs(CONTENT_ROOT, args.jobs)
+    files = build_index(docs)
+    written, sizes = write_index(CONTENT_ROOT / "search", files)
+    elapsed = time.perf_counter() - started
+
+    term_sizes = [size for name, size in sizes.items() if name.startswith("terms-")]
+    print(
+        f"[search] {len(docs)} docs, {files['index.json']['totalTerms']} terms, "
+        f"{len(term_sizes)} term shards (largest {max(term_sizes, default=0)} bytes), "
+        f"{written} file(s) rewritten in {elapsed:.3f}s."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Minify and precompress the built content JSON (post-build step).
+
+Vite copies `public/` into `dist/` as-is, so the pretty-printed JSON we keep
+in git for readable diffs would ship to production unchanged. This rewrites
+every `dist/content/**/*.json` in minified form and, for files of at least
+`--threshold` bytes, writes `.gz` and `.br` siblings next to it for servers
+and CDNs that serve precompressed variants. Hosts that cannot pick a variant
+(GitHub Pages, S3 behind CloudFront) should pass `--no-variants`: the files
+are then only minified, and the report still shows their compressed sizes.
+The sources under `public/` are never touched.
+
+Brotli output needs the `brotli` package (`pip install brotli`); without it
+only gzip variants are written.
+
+Usage:
+    npm run build && python3 scripts/compress_content.py [--no-variants]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None  # type: ignore[assignment]
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+DIST_CONTENT = ROOT_DIR / "dist" / "content"
+# Below about a kilobyte the compressed variant barely beats the headers.
+DEFAULT_THRESHOLD = 1024
+VARIANTS = ("gz", "br")
+
+
+def minify(raw: bytes) -> Optional[bytes]:
+    """Return compact JSON for ``raw``, or None when it does not parse."""
+    try:
+        payload = json.loads(raw)
+    except (UnicodeDecodeError, ValueError):
+        return None
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def compress(data: bytes) -> Dict[str, bytes]:
+    # mtime=0 keeps the gzip output byte-identical between builds.
+    variants = {"gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+    return variants
+
+
+def section_of(path: Path, content_dir: Path) -> str:
+    parts = path.relative_to(content_dir).parts
+    return parts[0] if len(parts) > 1 else "(root)"
+
+
+def process(content_dir: Path, threshold: int, write_variants: bool = True) -> Dict[str, Dict[str, int]]:
+    """Minify and compress in place; returns byte totals per section.
+
+    With ``write_variants`` false no `.gz`/`.br` files are kept, but their
+    sizes are still counted.
+    """
+    totals: Dict[str, Dict[str, int]] = {}
+    for path in sorted(content_dir.rglob("*.json")):
+        raw = path.read_bytes()
+        data = minify(raw)
+        if data is None:
+            print(f"[compress] Skipped {path.relative_to(content_dir)}: not valid JSON")
+            continue
+        if data != raw:
+            path.write_bytes(data)
+
+        stats = totals.setdefault(
+            section_of(path, content_dir),
+            {"files": 0, "source": 0, "minified": 0, "gz": 0, "br": 0},
+        )
+        stats["files"] += 1
+        stats["source"] += len(raw)
+        stats["minified"] += len(data)
+
+        variants = compress(data) if len(data) >= threshold else {}
+        for ext in VARIANTS:
+            target = path.with_name(f"{path.name}.{ext}")
+            if ext in variants and write_variants:
+                target.write_bytes(variants[ext])
+            elif target.exists():
+                os.remove(target)
+            # Small files are served as-is, so count them at their own size.
+            stats[ext] += len(variants.get(ext, data))
+    return totals
+
+
+def _kib(value: int) -> str:
+    return f"{value / 1024:.1f}"
+
+
+def _row(label: str, stats: Dict[str, int], columns: List[str]) -> str:
+    source = stats["source"] or 1
+    cells = "".join(
+        f"{_kib(stats[c]):>8} ({100 * (source - stats[c]) // source:>2}%)" for c in columns
+    )
+    return f"{label:<16}{stats['files']:>6}{_kib(stats['source']):>12}{cells}"
+
+
+def format_report(totals: Dict[str, Dict[str, int]], with_brotli: bool) -> List[str]:
+    columns = ["minified", "gz"] + (["br"] if with_brotli else [])
+    header = "".join(f"{c + ' KiB':>14}" for c in columns)
+    lines = [f"{'section':<16}{'files':>6}{'source KiB':>12}{header}"]
+    overall = {key: 0 for key in ("files", "source", "minified", "gz", "br")}
+    for section, stats in sorted(totals.items()):
+        for key in overall:
+            overall[key] += stats[key]
+        lines.append(_row(section, stats, columns))
+    lines.append(_row("total", overall, columns))
+    return lines
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Minify and precompress built content JSON.")
+    parser.add_argument(
+        "--content-dir",
+        type=Path,
+        default=DIST_CONTENT,
+        help="Built content directory (default: dist/content)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=int,
+        default=DEFAULT_THRESHOLD,
+        help=f"Minimum minified size in bytes for .gz/.br variants (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--no-variants",
+        action="store_true",
+        help="Only minify; do not write .gz/.br files (for hosts that cannot serve them)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.content_dir.is_dir():
+        raise SystemExit(f"{args.content_dir} does not exist; run `npm run build` first.")
+    if brotli is None and not args.no_variants:
+        print("[compress] brotli is not installed; writing gzip variants only.")
+
+    totals = process(args.content_dir, args.threshold, write_variants=not args.no_variants)
+    print("[compress] Bytes per section (saved vs source in parentheses):")
+    for line in format_report(totals, brotli is not None):
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,27 @@
 #!/usr/bin/env python3
 """
 Download and replace expired LinkedIn CDN image URLs with local copies.
-This script processes existing linkedin_posts_complete.json and downloads
-any images that are still using LinkedIn CDN URLs.
+This script processes the raw archive (data/social/linkedin_posts_complete.json),
+downloads any images that are still using LinkedIn CDN URLs and rewrites the
+display feed.
 """
 
 import requests
 import json
-from pathlib import Path
 import hashlib
 import mimetypes
 import sys
 
+from http_client import HttpClient
+from linkedin_feed import ARCHIVE_FILE, write_feed
+from linkedin_images import ORIGINALS_DIR, apply_image_fields, image_fields, save_image
+
 
 # Configuration
-INPUT_FILE = Path("public/content/social/linkedin_posts_complete.json")
-IMAGES_DIR = Path("public/content/social/linkedin-images")
+INPUT_FILE = ARCHIVE_FILE
 
-# Ensure images directory exists
-IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+# One pooled client for every API and CDN request
+http = HttpClient()
 
 
 def is_linkedin_url(url):
@@ -29,7 +32,10 @@ def is_linkedin_url(url):
 
 
 def download_image(image_url, post_id):
-    """Download image from URL and save locally, return local path"""
+    """Download an image, keep the original and return its resized derivatives.
+
+    Returns the ``linkedin_images.save_image`` fields, or None on failure.
+    """
     if not image_url:
         return None
 
@@ -38,16 +44,14 @@ def download_image(image_url, post_id):
         url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
         post_slug = post_id.split(':')[-1][:12] if post_id else 'unknown'
 
-        # Check if file already exists
-        existing_files = list(IMAGES_DIR.glob(f"{post_slug}-{url_hash}.*"))
+        # Check if the original already exists
+        existing_files = list(ORIGINALS_DIR.glob(f"{post_slug}-{url_hash}.*"))
         if existing_files:
-            filename = existing_files[0].name
-            relative_path = f"content/social/linkedin-images/{filename}"
-            print(f"  ✓ Already exists: {filename}")
-            return relative_path
+            print(f"  ✓ Already exists: {existing_files[0].name}")
+            return image_fields(existing_files[0])
 
         # Download image
-        response = requests.get(image_url, timeout=10)
+        response = http.get(image_url, timeout=10)
         response.raise_for_status()
 
         # Detect extension from content-type
@@ -56,17 +60,11 @@ def download_image(image_url, post_id):
         if ext == '.jpe':
             ext = '.jpg'
 
-        # Save to local file
+        # Save the original (not deployed) and its WebP/AVIF derivatives
         filename = f"{post_slug}-{url_hash}{ext}"
-        filepath = IMAGES_DIR / filename
-
-        with filepath.open('wb') as f:
-            f.write(response.content)
-
-        # Return relative path for JSON
-        relative_path = f"content/social/linkedin-images/{filename}"
-        print(f"  ✓ Downloaded: {filename} ({len(response.content)} bytes)")
-        return relative_path
+        fields = save_image(response.content, filename)
+        print(f"  ✓ Downloaded: {filename} ({len(response.content)} bytes, {len(fields['derivatives'])} derivative(s))")
+        return fields
 
     except requests.exceptions.RequestException as e:
         print(f"  ✗ Failed to download (expired or invalid URL): {str(e)[:100]}")
@@ -116,12 +114,11 @@ def process_posts():
             continue
 
         # Download and update
-        local_path = download_image(image_url, post_id)
-        if local_path:
+        fields = download_image(image_url, post_id)
+        if fields:
             # Update the media object
             media['original_image_url'] = image_url
-            media['local_image_path'] = local_path
-            media['image_url'] = local_path
+            apply_image_fields(media, fields)
             downloaded_count += 1
         else:
             failed_count += 1
@@ -139,8 +136,11 @@ def process_posts():
     with INPUT_FILE.open('w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
+    feed_written = write_feed(data)
+
     print("=" * 50)
     print(f"✓ Updated {INPUT_FILE}")
+    print(f"  - Display feed files rewritten: {feed_written}")
     print(f"  - Downloaded: {downloaded_count}")
     print(f"  - Skipped: {skipped_count}")
     print(f"  - Failed: {failed_count}")
@@ -148,4 +148,7 @@ def process_posts():
 
 
 if __name__ == "__main__":
-    process_posts()
+    try:
+        process_posts()
+    finally:
+        http.report()
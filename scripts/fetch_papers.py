@@ -1,16 +1,38 @@
+"""
+Fetch papers from the DTCC tracker into `public/content/papers/`.
+
+Papers are written once to `store.json`, each milestone file lists its
+paper ids, `index.json` lists the milestones and `facets.json` holds id
+lists per year, type, journal and author (see `paper_store.py`).
+
+Runs are churn-free: the by-milestone request is conditional (ETag /
+Last-Modified from the previous run, kept in `.cache/fetch-papers.json`),
+and a file is only rewritten when a hash of its content, ignoring
+`fetched_at`, differs from the file on disk. With `--exit-code` the script
+exits 0 when nothing changed and 2 when files were written, so CI can skip
+the commit and deploy; 1 is still an error.
+"""
+
 import requests
+import argparse
+import atexit
 import json
 import os
 import re
 from pathlib import Path
 from datetime import datetime, timezone
 
+from http_client import HttpClient
+from paper_store import RESERVED_NAMES, paper_key, paper_record, write_layout
+
 
 # Configuration
 TRACKER_USERNAME = os.getenv("TRACKER_USERNAME")
 TRACKER_PASSWORD = os.getenv("TRACKER_PASSWORD")
 API_BASE = "https://tracker.dtcc.chalmers.se/api"
 OUTPUT_DIR = Path("public/content/papers")
+STATE_PATH = Path(".cache/fetch-papers.json")
+EXIT_CHANGED = 2
 
 
 def slugify(name):
@@ -23,7 +45,8 @@ def slugify(name):
 
 def create_session():
     """Create authenticated session using cookies"""
-    session = requests.Session()
+    session = HttpClient()
+    atexit.register(session.report)
 
     url = f"{API_BASE}/auth/login"
     payload = {
@@ -41,49 +64,93 @@ def create_session():
     return session
 
 
-def fetch_papers_by_milestone(session):
-    """Fetch papers grouped by milestone"""
+def load_state():
+    """Validators saved by the previous run ({} when missing or unreadable)"""
+    try:
+        state = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_state(state):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    STATE_PATH.write_text(json.dumps(state, indent=2) + "\n", encoding="utf-8")
+
+
+def fetch_papers_by_milestone(session, validators=None):
+    """Fetch papers grouped by milestone.
+
+    Sends If-None-Match / If-Modified-Since from ``validators`` when given.
+    Returns ``(data, validators)``; ``data`` is None when the tracker
+    answered 304 Not Modified. Trackers without validators just return 200.
+    """
     url = f"{API_BASE}/papers/by-milestone"
 
-    response = session.get(url)
+    headers = {}
+    if validators and validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators and validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = session.get(url, headers=headers)
+    if response.status_code == 304:
+        return None, validators
     response.raise_for_status()
 
-    return response.json()
-
-
-def write_msp_file(msp_name, msp_data, timestamp):
-    """Write a single MSP JSON file"""
-    slug = slugify(msp_name)
-
-    output = {
-        "name": msp_name,
-        "slug": slug,
-        "count": msp_data.get("count", len(msp_data.get("papers", []))),
-        "fetched_at": timestamp,
-        "papers": [
-            {
-                "id": p.get("id"),
-                "doi": p.get("doi"),
-                "title": p.get("title"),
-                "author_name": p.get("author_name"),
-                "journal": p.get("journal"),
-                "date": p.get("date"),
-                "url": p.get("url"),
-                "publication_type": p.get("publication_type"),
-                "additional_authors": p.get("additional_authors", [])
-            }
-            for p in msp_data.get("papers", [])
-        ]
+    new_validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
     }
+    return response.json(), {k: v for k, v in new_validators.items() if v}
 
-    filepath = OUTPUT_DIR / f"{slug}.json"
-    with filepath.open('w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
 
-    return filepath, slug
+def normalize_milestones(milestones, timestamp):
+    """Split the tracker response into milestone id lists and one record per paper.
+
+    Returns ``(milestone entries, records by key)`` for
+    ``paper_store.write_layout``.
+    """
+    records = {}
+    entries = []
+    for msp_name, msp_data in milestones.items():
+        papers = msp_data.get("papers", [])
+        ids = []
+        for paper in papers:
+            key = paper_key(paper)
+            if key is None:
+                continue
+            records.setdefault(key, paper_record(paper))
+            ids.append(key)
+        entries.append({
+            "name": msp_name,
+            "slug": slugify(msp_name),
+            "count": msp_data.get("count", len(papers)),
+            "fetched_at": timestamp,
+            "ids": list(dict.fromkeys(ids)),
+        })
+    return entries, records
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Fetch papers grouped by milestone from the tracker.")
+    parser.add_argument(
+        "--exit-code",
+        action="store_true",
+        help=f"Exit 0 when nothing changed and {EXIT_CHANGED} when files were written",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Write store.json in the compact columnar layout",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Skip the conditional request and refetch everything",
+    )
+    args = parser.parse_args()
+
     # Check credentials
     if not TRACKER_USERNAME or not TRACKER_PASSWORD:
         print("Error: Missing environment variables")
@@ -109,8 +176,12 @@ def main():
 
     # Fetch papers
     print("Fetching papers...")
+    state = {} if args.force else load_state()
     try:
-        data = fetch_papers_by_milestone(session)
+        data, validators = fetch_papers_by_milestone(session, state.get("by_milestone"))
+        if data is None:
+            print("  Not modified since the last run; nothing to do.")
+            exit(0)
         total_papers = data.get("total_papers", 0)
         milestones = data.get("milestones", {})
         print(f"  Found {total_papers} papers across {len(milestones)} milestones\n")
@@ -120,19 +191,23 @@ def main():
 
     # Write files
     timestamp = datetime.now(timezone.utc).isoformat()
-    files_written = []
+    entries, records = normalize_milestones(milestones, timestamp)
 
     print("Writing JSON files...")
-    for msp_name, msp_data in milestones.items():
-        filepath, slug = write_msp_file(msp_name, msp_data, timestamp)
-        paper_count = msp_data.get("count", len(msp_data.get("papers", [])))
-        files_written.append((slug, paper_count))
-        print(f"  {slug}.json ({paper_count} papers)")
+    files_written = write_layout(OUTPUT_DIR, entries, records, columnar=args.columnar)
+    for name in files_written:
+        print(f"  {name}")
+
+    state["by_milestone"] = validators
+    save_state(state)
 
     # Summary
     print("\n" + "=" * 50)
-    print(f"Wrote {len(files_written)} files to {OUTPUT_DIR}/")
-    print(f"Total papers: {total_papers}")
+    print(f"Wrote {len(files_written)} files to {OUTPUT_DIR}/ ({len(entries) + len(RESERVED_NAMES) - len(files_written)} unchanged)")
+    print(f"Total papers: {total_papers} ({len(records)} unique)")
+
+    if args.exit_code and files_written:
+        exit(EXIT_CHANGED)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the sync scripts (`fetch_papers.py`,
+`linkedin_scrape.py`, `download_linkedin_images.py`).
+
+`HttpClient` wraps one `requests.Session`, so connections are pooled and
+reused, and adds what the daily workflows need to stay bounded:
+
+- a default `(connect, read)` timeout on every request;
+- retries on connection errors, timeouts, 429 and 500/502/503/504, with
+  exponential backoff and full jitter. `Retry-After` (seconds or an HTTP
+  date) and `X-RateLimit-Reset`/`RateLimit-Reset` are honored when present;
+  a wait longer than `max_retry_after` returns the response instead;
+- a per-host concurrency cap, so threaded callers do not flood one API;
+- per-host timing stats, printed with `report()` at the end of a run.
+
+Only idempotent methods are retried; a POST (e.g. a login) is sent once.
+Responses are returned as-is after the last attempt, so callers keep using
+`raise_for_status()`.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = (5.0, 30.0)
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+MAX_RETRY_AFTER = 120.0
+DEFAULT_PER_HOST = 4
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RESET_HEADERS = ("Retry-After", "X-RateLimit-Reset", "RateLimit-Reset")
+
+
+def retry_after_seconds(response: requests.Response, now: Optional[float] = None) -> Optional[float]:
+    """Seconds the server asked us to wait, or None when it did not say.
+
+    `Retry-After` is either delta-seconds or an HTTP date. Reset headers are
+    either delta-seconds or, when larger than a day, an epoch timestamp.
+    """
+    now = time.time() if now is None else now
+    for header in RESET_HEADERS:
+        value = response.headers.get(header)
+        if not value:
+            continue
+        value = value.strip()
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - now
+            except (TypeError, ValueError):
+                continue
+        else:
+            if seconds > 86400:
+                seconds -= now
+        return max(seconds, 0.0)
+    return None
+
+
+class HostStats:
+    """Timing and outcome counters for one host."""
+
+    def __init__(self) -> None:
+        self.durations: List[float] = []
+        self.retries = 0
+        self.failures = 0
+        self.waited = 0.0
+        self.statuses: Dict[int, int] = {}
+
+    def summary(self) -> str:
+        ordered = sorted(self.durations)
+        count = len(ordered)
+        median = ordered[count // 2] if count else 0.0
+        worst = ordered[-1] if count else 0.0
+        codes = ", ".join(f"{code}x{n}" for code, n in sorted(self.statuses.items()))
+        return (
+            f"{count} request(s), median {median * 1000:.0f}ms, max {worst * 1000:.0f}ms, "
+            f"total {sum(ordered):.2f}s; {self.retries} retried, {self.failures} failed, "
+            f"{self.waited:.1f}s backing off" + (f" [{codes}]" if codes else "")
+        )
+
+
+class HttpClient:
+    """Pooled `requests.Session` with timeouts, retries and per-host caps."""
+
+    def __init__(
+        self,
+        *,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = MAX_BACKOFF,
+        max_retry_after: float = MAX_RETRY_AFTER,
+        per_host: int = DEFAULT_PER_HOST,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.per_host = per_host
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(per_host, 1))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+        self.stats: Dict[str, HostStats] = {}
+        self._limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def _host(self, url: str) -> Tuple[threading.BoundedSemaphore, HostStats]:
+        host = urlparse(url).netloc or url
+        with self._lock:
+            if host not in self._limits:
+                self._limits[host] = threading.BoundedSemaphore(max(self.per_host, 1))
+                self.stats[host] = HostStats()
+            return self._limits[host], self.stats[host]
+
+    def _delay(self, attempt: int, response: Optional[requests.Response]) -> Optional[float]:
+        """Backoff before retry ``attempt`` (1-based); None means give up."""
+        if response is not None:
+            asked = retry_after_seconds(response)
+            if asked is not None:
+                return asked if asked <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** (attempt - 1))))
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        method = method.upper()
+        attempts = self.retries + 1 if method in RETRY_METHODS else 1
+        limit, stats = self._host(url)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            response: Optional[requests.Response] = None
+            error: Optional[requests.exceptions.RequestException] = None
+            with limit:
+                started = time.perf_counter()
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+                    error = exc
+                elapsed = time.perf_counter() - started
+            with self._lock:
+                stats.durations.append(elapsed)
+                if response is not None:
+                    stats.statuses[response.status_code] = stats.statuses.get(response.status_code, 0) + 1
+
+            retryable = error is not None or response.status_code in RETRY_STATUSES
+            delay = self._delay(attempt, response) if retryable and attempt < attempts else None
+            if delay is None:
+                if error is not None or response.status_code >= 400:
+                    with self._lock:
+                        stats.failures += 1
+                if error is not None:
+                    raise error
+                return response
+
+            reason = error.__class__.__name__ if error is not None else f"HTTP {response.status_code}"
+            print(f"[http] {reason} from {urlparse(url).netloc}; retry {attempt}/{attempts - 1} in {delay:.1f}s")
+            with self._lock:
+                stats.retries += 1
+                stats.waited += delay
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def report(self) -> None:
+        """Print per-host timing stats for this run."""
+        elapsed = time.perf_counter() - self._started
+        total = sum(len(stats.durations) for stats in self.stats.values())
+        print(f"[http] {total} request(s) in {elapsed:.2f}s wall time")
+        for host, stats in sorted(self.stats.items()):
+            print(f"[http]   {host}: {stats.summary()}")
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,111 @@
+"""
+Read image dimensions from file headers and build tiny LQIP placeholders.
+
+Dimensions come from the PNG, JPEG, GIF, WebP and AVIF headers directly, so
+no image library is needed for them. Placeholders need Pillow
+(`pip install pillow`); without it `placeholder_data_uri` returns None.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None  # type: ignore[assignment]
+
+
+# Lookup order when probing `<slug>.<ext>`; matches the frontend's old probe.
+IMAGE_EXTENSIONS = ("avif", "webp", "jpeg", "jpg", "png")
+PLACEHOLDER_SIZE = 16
+HEADER_BYTES = 64 * 1024
+
+
+def _jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    offset = 2
+    while offset + 9 < len(data):
+        if data[offset] != 0xFF:
+            offset += 1
+            continue
+        marker = data[offset + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            offset += 2
+            continue
+        (length,) = struct.unpack(">H", data[offset + 2 : offset + 4])
+        # SOF0..SOF15 carry the frame size, except DHT/JPG/DAC.
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">HH", data[offset + 5 : offset + 9])
+            return width, height
+        offset += 2 + length
+    return None
+
+
+def _webp_size(data: bytes) -> Optional[Tuple[int, int]]:
+    chunk = data[12:16]
+    if chunk == b"VP8 " and len(data) >= 30:
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and len(data) >= 25:
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X" and len(data) >= 30:
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def _avif_size(data: bytes) -> Optional[Tuple[int, int]]:
+    # The image spatial extents ('ispe') property holds the primary size.
+    index = data.find(b"ispe")
+    if index < 0 or index + 16 > len(data):
+        return None
+    width, height = struct.unpack(">II", data[index + 8 : index + 16])
+    return width, height
+
+
+def probe_image(path: Path) -> Optional[Dict[str, object]]:
+    """Return ``{"width", "height", "format"}`` from the header, or None."""
+    try:
+        with path.open("rb") as fh:
+            data = fh.read(HEADER_BYTES)
+    except OSError:
+        return None
+
+    size: Optional[Tuple[int, int]] = None
+    fmt: Optional[str] = None
+    if data.startswith(b"\x89PNG\r\n\x1a\n") and len(data) >= 24:
+        size, fmt = struct.unpack(">II", data[16:24]), "png"
+    elif data.startswith(b"\xff\xd8"):
+        size, fmt = _jpeg_size(data), "jpeg"
+    elif data[:6] in (b"GIF87a", b"GIF89a") and len(data) >= 10:
+        size, fmt = struct.unpack("<HH", data[6:10]), "gif"
+    elif data.startswith(b"RIFF") and data[8:12] == b"WEBP":
+        size, fmt = _webp_size(data), "webp"
+    elif data[4:8] == b"ftyp" and data[8:12] in (b"avif", b"avis"):
+        size, fmt = _avif_size(data), "avif"
+
+    if not size or not fmt:
+        return None
+    return {"width": int(size[0]), "height": int(size[1]), "format": fmt}
+
+
+def placeholder_data_uri(path: Path, size: int = PLACEHOLDER_SIZE) -> Optional[str]:
+    """Downscale to at most ``size`` px and return a base64 WebP data URI."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(path) as img:
+            img.draft("RGB", (size * 4, size * 4))
+            thumb = img.convert("RGB")
+            thumb.thumbnail((size, size))
+            buffer = io.BytesIO()
+            thumb.save(buffer, format="WEBP", quality=40, method=6)
+    except (OSError, ValueError):
+        return None
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
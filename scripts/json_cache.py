@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Small persistent key/value cache for the sync scripts, stored as one JSON
+file (by default under the git-ignored `.cache/` directory).
+
+Entries expire after a TTL, or earlier when the caller passes an explicit
+`expires_at` (e.g. a signed CDN URL's own expiry). When the cache holds more
+than `max_entries`, the least recently used entries are dropped on save.
+All methods are thread-safe, so pipeline stages can share one instance.
+
+    cache = JsonCache(Path(".cache/linkedin.json"), ttl=30 * 86400)
+    cache.load()
+    post = cache.get("post:urn:li:share:1")
+    cache.set("post:urn:li:share:1", payload)
+    cache.save()
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CACHE_VERSION = 1
+DEFAULT_TTL = 30 * 86400.0
+DEFAULT_MAX_ENTRIES = 5000
+
+
+class JsonCache:
+    """JSON-file cache with per-entry expiry and an LRU size cap."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def load(self) -> "JsonCache":
+        """Read the cache file, dropping expired entries (a missing file is empty)."""
+        if not self.enabled:
+            return self
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = {}
+        entries = payload.get("entries") if isinstance(payload, dict) else None
+        if not isinstance(entries, dict) or payload.get("version") != CACHE_VERSION:
+            entries = {}
+        now = time.time()
+        with self._lock:
+            self._entries = {
+                key: entry
+                for key, entry in entries.items()
+                if isinstance(entry, dict) and entry.get("expires_at", 0) > now
+            }
+            self.evicted += len(entries) - len(self._entries)
+            self._dirty = self.evicted > 0
+        return self
+
+    def get(self, key: str) -> Any:
+        """The cached value, or None when missing or expired."""
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.get("expires_at", 0) <= now:
+                if entry is not None:
+                    del self._entries[key]
+                    self.evicted += 1
+                    self._dirty = True
+                self.misses += 1
+                return None
+            entry["used_at"] = now
+            self._dirty = True
+            self.hits += 1
+            return entry["value"]
+
+    def set(self, key: str, value: Any, expires_at: Optional[float] = None) -> None:
+        """Store ``value`` until ``expires_at`` or the TTL, whichever comes first."""
+        if not self.enabled:
+            return
+        now = time.time()
+        deadline = now + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        if deadline <= now:
+            return
+        with self._lock:
+            self._entries[key] = {"value": value, "stored_at": now, "used_at": now, "expires_at": deadline}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache when it changed, keeping the ``max_entries`` most recently used."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if len(self._entries) > self.max_entries:
+                ranked = sorted(self._entries, key=lambda key: self._entries[key].get("used_at", 0), reverse=True)
+                for key in ranked[self.max_entries:]:
+                    del self._entries[key]
+                    self.evicted += 1
+                self._dirty = True
+            if not self._dirty:
+                return
+            payload = {"version": CACHE_VERSION, "entries": self._entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+            tmp_path.replace(self.path)
+            self._dirty = False
+
+    def report(self, label: str = "cache") -> None:
+        print(
+            f"[{label}] {self.hits} hit(s), {self.misses} miss(es), {self.evicted} evicted, "
+            f"{len(self._entries)} entr{'y' if len(self._entries) == 1 else 'ies'} in {self.path}"
+        )
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Write the slim LinkedIn display feed from the raw post archive.
+
+`linkedin_scrape.py` keeps every post, with the complete API payload, in
+`data/social/linkedin_posts_complete.json`. That file is scraper state and
+is not deployed. The social feed only needs a few fields per post, so this
+module writes them to `public/content/social/`:
+
+- `linkedin_feed.json`: the newest `window` posts, plus the archive pages
+  (newest first) as `{"file", "page", "count"}`;
+- `linkedin_feed.page-<n>.json`: older posts, `page_size` per file. Pages
+  are cut from the oldest post, as the section manifests are, so a new post
+  only changes the last page and earlier pages stay byte-identical.
+
+A post is `{"id", "url", "date", "text", "image", "width", "height",
+"srcset"}`. `date` is the publish time in epoch milliseconds, `text` the
+commentary as plain text, trimmed to `TEXT_LIMIT` characters. `width`/
+`height` are the original image's (from the archive, else the local file
+header) and are omitted when unknown. `srcset` maps a format (`avif`,
+`webp`) to a srcset string of the resized derivatives from
+`linkedin_images.py`. Posts with neither text nor image are left out.
+
+Both scrapers call `write_feed` after saving the archive. Running this
+module rebuilds the feed from the archive and reports the sizes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from image_metadata import probe_image  # noqa: E402
+from update_news_projects_manifest import write_if_changed  # noqa: E402
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+ARCHIVE_FILE = ROOT_DIR / "data" / "social" / "linkedin_posts_complete.json"
+PUBLIC_DIR = ROOT_DIR / "public"
+FEED_DIR = PUBLIC_DIR / "content" / "social"
+FEED_NAME = "linkedin_feed.json"
+PAGE_GLOB = "linkedin_feed.page-*.json"
+FEED_WINDOW = 20
+PAGE_SIZE = 20
+TEXT_LIMIT = 220
+
+RE_MENTION = re.compile(r"@\[(.*?)\]\([^)]+\)")
+RE_SPACE = re.compile(r"\s+")
+
+
+def plain_text(commentary: str, limit: int = TEXT_LIMIT) -> str:
+    """Mentions reduced to their names, whitespace collapsed, cut at ``limit``."""
+    text = RE_SPACE.sub(" ", RE_MENTION.sub(r"\1", commentary or "")).strip()
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + "…"
+
+
+def feed_post(post: Dict[str, Any], public_dir: Path = PUBLIC_DIR) -> Optional[Dict[str, Any]]:
+    """Display fields of one archive entry, or None when there is nothing to show."""
+    original = post.get("original_data") or {}
+    media = post.get("media") or {}
+    post_id = post.get("post_id") or original.get("id")
+    text = plain_text(str(post.get("commentary") or original.get("commentary") or ""))
+    image = media.get("image_url")
+    if not text and not image:
+        return None
+
+    entry: Dict[str, Any] = {
+        "id": post_id,
+        "url": post.get("post_url") or (f"https://www.linkedin.com/feed/update/{post_id}/" if post_id else None),
+        "date": post.get("published_at") or original.get("publishedAt") or original.get("createdAt"),
+        "text": text,
+        "image": image,
+    }
+    if media.get("width") and media.get("height"):
+        entry["width"] = media["width"]
+        entry["height"] = media["height"]
+    elif image and not image.startswith(("http://", "https://")):
+        meta = probe_image(public_dir / image)
+        if meta:
+            entry["width"] = meta["width"]
+            entry["height"] = meta["height"]
+    srcset: Dict[str, List[str]] = {}
+    for derivative in sorted(media.get("derivatives") or [], key=lambda d: d["width"]):
+        srcset.setdefault(derivative["format"], []).append(f"{derivative['path']} {derivative['width']}w")
+    if srcset:
+        entry["srcset"] = {fmt: ", ".join(candidates) for fmt, candidates in srcset.items()}
+    return entry
+
+
+def _render(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def page_name(number: int) -> str:
+    return PAGE_GLOB.replace("*", str(number))
+
+
+def build_feed(
+    posts: Iterable[Dict[str, Any]],
+    *,
+    window: int = FEED_WINDOW,
+    page_size: int = PAGE_SIZE,
+    public_dir: Path = PUBLIC_DIR,
+) -> Dict[str, Any]:
+    """Return ``{filename: payload}`` for the feed head and its archive pages."""
+    entries = [entry for entry in (feed_post(post, public_dir) for post in posts) if entry]
+    entries.sort(key=lambda entry: entry.get("date") or 0, reverse=True)
+    recent, older = entries[:window], entries[window:]
+
+    growth = list(reversed(older))
+    chunks = [growth[start : start + page_size] for start in range(0, len(growth), page_size)]
+    files: Dict[str, Any] = {}
+    archive: List[Dict[str, Any]] = []
+    for number, chunk in enumerate(chunks, start=1):
+        files[page_name(number)] = {"page": number, "posts": list(reversed(chunk))}
+        archive.append({"file": page_name(number), "page": number, "count": len(chunk)})
+    archive.reverse()
+
+    files[FEED_NAME] = {"total": len(entries), "window": window, "posts": recent, "archive": archive}
+    return files
+
+
+def write_feed(
+    archive_data: Dict[str, Any],
+    *,
+    feed_dir: Path = FEED_DIR,
+    window: int = FEED_WINDOW,
+    page_size: int = PAGE_SIZE,
+) -> int:
+    """Write the feed for ``archive_data`` (the archive JSON); returns files rewritten."""
+    files = build_feed(archive_data.get("posts", []), window=window, page_size=page_size)
+    feed_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for name, payload in files.items():
+        written += write_if_changed(feed_dir / name, _render(payload))
+    for stale in feed_dir.glob(PAGE_GLOB):
+        if stale.name not in files:
+            stale.unlink()
+            written += 1
+    return written
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the LinkedIn display feed from the raw archive.")
+    parser.add_argument("--archive", type=Path, default=ARCHIVE_FILE)
+    parser.add_argument("--window", type=int, default=FEED_WINDOW, help="Posts in linkedin_feed.json")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE, help="Posts per archive page")
+    args = parser.parse_args(argv)
+
+    archive_data = json.loads(args.archive.read_text(encoding="utf-8"))
+    written = write_feed(archive_data, window=args.window, page_size=args.page_size)
+
+    raw = args.archive.read_bytes()
+    head = (FEED_DIR / FEED_NAME).read_bytes()
+    feed_files = [FEED_DIR / FEED_NAME, *sorted(FEED_DIR.glob(PAGE_GLOB))]
+    total = sum(path.stat().st_size for path in feed_files)
+    print(f"[feed] {len(archive_data.get('posts', []))} archived posts; {written} feed file(s) rewritten.")
+    print(
+        f"[feed] First load: {len(head)} bytes ({len(gzip.compress(head))} gzip) "
+        f"instead of {len(raw)} bytes ({len(gzip.compress(raw))} gzip) for the raw archive."
+    )
+    print(f"[feed] All {len(feed_files)} deployed feed file(s): {total} bytes.")
+
+
+if __name__ == "__main__":
+    main()
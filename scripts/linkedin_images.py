@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Resized WebP/AVIF derivatives for downloaded LinkedIn images.
+
+LinkedIn serves originals of up to 2048px, while the social feed shows them
+as cards about 400px wide. Downloads are therefore split in two:
+
+- the original goes to `data/social/linkedin-originals/`, which is committed
+  (so derivatives can be rebuilt at other sizes) but not deployed;
+- `public/content/social/linkedin-images/` only holds derivatives named
+  `<stem>-<width>w.<webp|avif>`, for each width in `WIDTHS` smaller than the
+  original (or one at the original width when it is smaller than all of them).
+
+`save_image` stores one download and returns the fields the archive keeps
+in a post's `media`: the deployed fallback path (largest WebP), the original
+`width`/`height` and the `derivatives`. AVIF needs a Pillow build with AVIF
+support and is skipped otherwise; without Pillow at all the original is
+copied into the deployed directory unchanged, as before.
+
+Run with `--migrate` to move the existing originals out of the deployed
+directory and convert every image the archive references, `--jobs` at a time.
+Originals and derivatives no post in the archive references are deleted, so
+the repository only carries images the feed can show. Rerunning it on an
+already migrated tree changes nothing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from image_metadata import probe_image  # noqa: E402
+from linkedin_feed import ARCHIVE_FILE, write_feed  # noqa: E402
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # pragma: no cover - optional dependency
+    Image = ImageOps = features = None  # type: ignore[assignment]
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+ORIGINALS_DIR = ROOT_DIR / "data" / "social" / "linkedin-originals"
+IMAGES_DIR = ROOT_DIR / "public" / "content" / "social" / "linkedin-images"
+IMAGES_URL = "content/social/linkedin-images"
+# Card width is 260-400 CSS px, so 480w covers 1x and 960w covers 2x screens.
+WIDTHS = (480, 960)
+QUALITY = {"avif": 55, "webp": 78}
+ORIGINAL_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+RE_DERIVATIVE = re.compile(r"-\d+w\.(?:webp|avif)$")
+
+
+def available_formats() -> List[str]:
+    """Derivative formats this Pillow build can write, best first."""
+    if Image is None:
+        return []
+    formats = ["webp"] if features.check("webp") else []
+    try:
+        if features.check("avif"):
+            formats.insert(0, "avif")
+    except ValueError:  # Pillow versions without the AVIF feature flag
+        pass
+    return formats
+
+
+def target_widths(width: int) -> List[int]:
+    widths = [w for w in WIDTHS if w < width]
+    return widths or [width]
+
+
+def make_derivatives(original: Path, out_dir: Path = IMAGES_DIR) -> Optional[Dict[str, Any]]:
+    """Write the missing derivatives of ``original``; returns its image fields.
+
+    Existing derivative files are reused, so reruns only probe headers.
+    Returns None when the file cannot be read or no format is available.
+    """
+    formats = available_formats()
+    meta = probe_image(original)
+    if not formats or not meta:
+        return None
+    width, height = meta["width"], meta["height"]
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    derivatives: List[Dict[str, Any]] = []
+    image = None
+    try:
+        for target in target_widths(width):
+            size = (target, max(1, round(height * target / width)))
+            for fmt in formats:
+                name = f"{original.stem}-{target}w.{fmt}"
+                path = out_dir / name
+                if not path.exists():
+                    if image is None:
+                        image = ImageOps.exif_transpose(Image.open(original))
+                        if image.mode not in ("RGB", "RGBA"):
+                            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+                    tmp_path = path.with_name(f".{name}.tmp")
+                    image.resize(size, Image.LANCZOS).save(tmp_path, fmt.upper(), quality=QUALITY[fmt])
+                    tmp_path.replace(path)
+                derivatives.append(
+                    {"path": f"{IMAGES_URL}/{name}", "width": size[0], "height": size[1], "format": fmt}
+                )
+    except OSError as exc:
+        print(f"  ✗ Could not convert {original.name}: {exc}")
+        return None
+    finally:
+        if image is not None:
+            image.close()
+
+    webp = [d for d in derivatives if d["format"] == "webp"]
+    fallback = max(webp, key=lambda d: d["width"]) if webp else derivatives[-1]
+    return {"path": fallback["path"], "width": width, "height": height, "derivatives": derivatives}
+
+
+def save_image(data: bytes, filename: str) -> Dict[str, Any]:
+    """Store a downloaded original and derive its deployed images.
+
+    Returns ``{"path", "width", "height", "derivatives", "original"}``; without
+    Pillow, ``path`` is a plain copy of the original in the deployed directory.
+    """
+    ORIGINALS_DIR.mkdir(parents=True, exist_ok=True)
+    original = ORIGINALS_DIR / filename
+    original.write_bytes(data)
+    return image_fields(original)
+
+
+def image_fields(original: Path) -> Dict[str, Any]:
+    fields = make_derivatives(original)
+    if fields is None:
+        IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(original, IMAGES_DIR / original.name)
+        meta = probe_image(original) or {}
+        fields = {
+            "path": f"{IMAGES_URL}/{original.name}",
+            "width": meta.get("width"),
+            "height": meta.get("height"),
+            "derivatives": [],
+        }
+    fields["original"] = str(original.relative_to(ROOT_DIR))
+    return fields
+
+
+def apply_image_fields(media: Dict[str, Any], fields: Dict[str, Any]) -> None:
+    """Point a post's ``media`` at the deployed derivative and record dimensions."""
+    media["local_image_path"] = fields["path"]
+    media["image_url"] = fields["path"]
+    media["width"] = fields["width"]
+    media["height"] = fields["height"]
+    media["derivatives"] = fields["derivatives"]
+    media["original_path"] = fields["original"]
+
+
+def _convert(original: str) -> Optional[Dict[str, Any]]:
+    path = Path(original)
+    return image_fields(path) if path.exists() else None
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(child.stat().st_size for child in path.iterdir() if child.is_file()) if path.is_dir() else 0
+
+
+def prune(referenced: Iterable[str]) -> int:
+    """Delete originals and derivatives whose stem is not in ``referenced``."""
+    stems = set(referenced)
+    removed = 0
+    for path in sorted(ORIGINALS_DIR.glob("*")):
+        if path.is_file() and path.stem not in stems:
+            path.unlink()
+            removed += 1
+    for path in sorted(IMAGES_DIR.glob("*")):
+        if path.is_file() and RE_DERIVATIVE.sub("", path.name) not in stems and path.stem not in stems:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def migrate(archive_file: Path, jobs: int) -> None:
+    """Move deployed originals to ORIGINALS_DIR, convert what the archive uses
+    and prune the rest."""
+    before = _dir_bytes(IMAGES_DIR)
+    ORIGINALS_DIR.mkdir(parents=True, exist_ok=True)
+    moved = 0
+    for path in sorted(IMAGES_DIR.glob("*")):
+        if path.suffix.lower() in ORIGINAL_EXTENSIONS and not RE_DERIVATIVE.search(path.name):
+            shutil.move(str(path), ORIGINALS_DIR / path.name)
+            moved += 1
+
+    data = json.loads(archive_file.read_text(encoding="utf-8"))
+    targets: Dict[str, List[Dict[str, Any]]] = {}
+    for post in data.get("posts", []):
+        media = post.get("media") or {}
+        local = media.get("original_path") or media.get("local_image_path")
+        if not local:
+            continue
+        original = ORIGINALS_DIR / Path(local).name
+        targets.setdefault(str(original), []).append(media)
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        results = list(pool.map(_convert, targets))
+    elapsed = time.perf_counter() - started
+
+    converted = 0
+    for (original, medias), fields in zip(targets.items(), results):
+        if fields is None:
+            print(f"  ✗ Missing original {Path(original).name}")
+            continue
+        converted += 1
+        for media in medias:
+            apply_image_fields(media, fields)
+
+    rendered = json.dumps(data, indent=2, ensure_ascii=False)
+    if archive_file.read_text(encoding="utf-8") != rendered:
+        archive_file.write_text(rendered, encoding="utf-8")
+    pruned = prune(Path(original).stem for original in targets)
+    after = _dir_bytes(IMAGES_DIR)
+    print(f"[images] Moved {moved} original(s) to {ORIGINALS_DIR.relative_to(ROOT_DIR)}.")
+    print(f"[images] Converted {converted} referenced image(s) with {jobs} job(s) in {elapsed:.2f}s.")
+    print(f"[images] Pruned {pruned} unreferenced original(s) and derivative(s).")
+    print(f"[images] Deployed {IMAGES_DIR.relative_to(ROOT_DIR)}: {before} -> {after} bytes.")
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build resized LinkedIn image derivatives.")
+    parser.add_argument("--migrate", action="store_true", help="Convert the existing images (one-time)")
+    parser.add_argument("--archive", type=Path, default=ARCHIVE_FILE)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel conversions")
+    args = parser.parse_args(argv)
+
+    if not args.migrate:
+        parser.error("nothing to do; pass --migrate to convert the existing images")
+    if not available_formats():
+        parser.error("Pillow with WebP support is required (pip install pillow)")
+    migrate(args.archive, args.jobs)
+    written = write_feed(json.loads(args.archive.read_text(encoding="utf-8")))
+    print(f"[images] Rewrote {written} feed file(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,62 @@
 import requests
+import argparse
+import copy
 import json
-from urllib.parse import quote, urlparse
+from urllib.parse import parse_qs, quote, unquote, urlparse
 import os
 from pathlib import Path
 import hashlib
 import mimetypes
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from http_client import HttpClient
+from json_cache import JsonCache
+from linkedin_feed import ARCHIVE_FILE, write_feed
+from linkedin_images import IMAGES_DIR, apply_image_fields, save_image
 
 
 # Configuration
 ACCESS_TOKEN = os.getenv("LINKEDIN_ACCESS_TOKEN")
 ORGANIZATION_ID = "100491988"
 POSTS_API_BASE = "https://api.linkedin.com/rest/posts"
-OUTPUT_FILE = Path("public/content/social/linkedin_posts_complete.json")
-IMAGES_DIR = Path("public/content/social/linkedin-images")
+IMAGES_API_BASE = "https://api.linkedin.com/rest/images"
+# Raw archive of every post (not deployed); the site reads the slim feed
+OUTPUT_FILE = ARCHIVE_FILE
+# Reshare parents, image details and resolved media across runs (not deployed)
+CACHE_FILE = Path(".cache/linkedin-scrape.json")
+CACHE_TTL = 30 * 86400
+CACHE_MAX_ENTRIES = 5000
+PAGE_SIZE = 20
+# Concurrent requests per processing stage; matches the HTTP client's per-host cap
+WORKERS = 4
+# Image URNs per Images API batch get (1 disables batching)
+IMAGE_BATCH_SIZE = 50
+
+# One pooled client for every API and CDN request
+http = HttpClient()
 
 # Ensure images directory exists
 IMAGES_DIR.mkdir(parents=True, exist_ok=True)
 
+def api_headers(access_token):
+    """Headers for the LinkedIn REST API"""
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "X-Restli-Protocol-Version": "2.0.0",
+        "LinkedIn-Version": "202601"
+    }
+
+
 def get_post_url(post_id):
     """Convert post ID/URN to a shareable LinkedIn URL"""
     return f"https://www.linkedin.com/feed/update/{post_id}/"
 
 def download_image(image_url, post_id):
-    """Download image from URL and save locally, return local path"""
+    """Download an image, keep the original and return its resized derivatives.
+
+    Returns the ``linkedin_images.save_image`` fields, or None on failure.
+    """
     if not image_url:
         return None
 
@@ -32,7 +66,7 @@ def download_image(image_url, post_id):
         post_slug = post_id.split(':')[-1][:12] if post_id else 'unknown'
 
         # Download image
-        response = requests.get(image_url, timeout=10)
+        response = http.get(image_url, timeout=10)
         response.raise_for_status()
 
         # Detect extension from content-type
@@ -41,17 +75,11 @@ def download_image(image_url, post_id):
         if ext == '.jpe':
             ext = '.jpg'
 
-        # Save to local file
+        # Save the original (not deployed) and its WebP/AVIF derivatives
         filename = f"{post_slug}-{url_hash}{ext}"
-        filepath = IMAGES_DIR / filename
-
-        with filepath.open('wb') as f:
-            f.write(response.content)
-
-        # Return relative path for JSON
-        relative_path = f"content/social/linkedin-images/{filename}"
-        print(f"  ✓ Downloaded image: {filename} ({len(response.content)} bytes)")
-        return relative_path
+        fields = save_image(response.content, filename)
+        print(f"  ✓ Downloaded image: {filename} ({len(response.content)} bytes, {len(fields['derivatives'])} derivative(s))")
+        return fields
 
     except Exception as e:
         print(f"  ✗ Failed to download image: {e}")
@@ -61,23 +89,84 @@ def get_image_details(image_urn, access_token):
     """Fetch image details including download URL from Images API"""
     encoded_urn = quote(image_urn, safe='')
     
-    url = f"https://api.linkedin.com/rest/images/{encoded_urn}"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "X-Restli-Protocol-Version": "2.0.0",
-        "LinkedIn-Version": "202601"
-    }
+    url = f"{IMAGES_API_BASE}/{encoded_urn}"
     
     try:
-        response = requests.get(url, headers=headers)
+        response = http.get(url, headers=api_headers(access_token))
         response.raise_for_status()
         return response.json()
     except Exception as e:
         print(f"Error fetching image {image_urn}: {e}")
         return None
 
-def extract_media_info(post, access_token):
-    """Extract media information from a post and fetch image URLs"""
+def get_image_details_batch(urns, access_token):
+    """Batch get (``ids=List(...)``) from the Images API; returns ``{urn: details}``.
+
+    URNs the batch rejects or omits are simply absent from the result.
+    """
+    ids = ",".join(quote(urn, safe='') for urn in urns)
+    # Built by hand: requests would re-encode the Rest.li List(...) syntax
+    url = f"{IMAGES_API_BASE}?ids=List({ids})"
+
+    try:
+        response = http.get(url, headers=api_headers(access_token))
+        response.raise_for_status()
+        data = response.json()
+    except Exception as e:
+        print(f"Error fetching image batch of {len(urns)}: {e}")
+        return {}
+    for urn, error in (data.get('errors') or {}).items():
+        print(f"  ✗ Batch rejected {unquote(urn)}: {error.get('message', error) if isinstance(error, dict) else error}")
+    return {unquote(urn): details for urn, details in (data.get('results') or {}).items()}
+
+
+def download_url_expiry(details):
+    """Epoch seconds at which a signed ``downloadUrl`` stops working (``e=`` parameter)"""
+    query = parse_qs(urlparse((details or {}).get('downloadUrl') or '').query)
+    try:
+        return int(query['e'][0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def resolve_image_details(urns, access_token, cache, batch_size=IMAGE_BATCH_SIZE, workers=WORKERS):
+    """Image details for every URN: cache first, then batch gets, then single gets"""
+    details = {}
+    for urn in dict.fromkeys(urns):
+        cached = cache.get(f"image:{urn}")
+        if cached is not None:
+            details[urn] = cached
+    urns = [urn for urn in dict.fromkeys(urns) if urn not in details]
+    cached_count = len(details)
+    batches = []
+    if batch_size > 1 and len(urns) > 1:
+        batches = [urns[i:i + batch_size] for i in range(0, len(urns), batch_size)]
+        for found in run_stage("image batches", lambda batch: get_image_details_batch(batch, access_token), batches, workers):
+            details.update(found)
+
+    missing = [urn for urn in urns if urn not in details]
+    singles = run_stage("image details", lambda urn: get_image_details(urn, access_token), missing, workers)
+    details.update((urn, found) for urn, found in zip(missing, singles) if found)
+    for urn in urns:
+        if urn in details:
+            # Signed download URLs expire; never serve one past that point
+            cache.set(f"image:{urn}", details[urn], expires_at=download_url_expiry(details[urn]))
+
+    calls = len(batches) + len(missing)
+    print(
+        f"[images] {len(urns)} image URN(s) resolved with {calls} call(s) "
+        f"({len(batches)} batch, {len(missing)} single); saved {len(urns) - calls} call(s), "
+        f"{cached_count} from the cache"
+    )
+    return details
+
+
+def extract_media_info(post, image_details_for):
+    """Extract media information from a post.
+
+    ``image_details_for(urn)`` returns the Images API record of an image URN
+    (or None); the download URL is taken from it.
+    """
     media_info = {
         "has_media": False,
         "media_type": None,
@@ -100,7 +189,7 @@ def extract_media_info(post, access_token):
         if 'image' in media_urn:
             media_info["media_type"] = "image"
             # Fetch image URL
-            image_details = get_image_details(media_urn, access_token)
+            image_details = image_details_for(media_urn)
             if image_details:
                 media_info["image_url"] = image_details.get('downloadUrl')
         elif 'video' in media_urn:
@@ -120,7 +209,7 @@ def extract_media_info(post, access_token):
             media_info["media_type"] = "image"
             # Fetch image URL using existing function
             if 'image' in media_urn:
-                image_details = get_image_details(media_urn, access_token)
+                image_details = image_details_for(media_urn)
                 if image_details:
                     media_info["image_url"] = image_details.get('downloadUrl')
 
@@ -133,7 +222,7 @@ def extract_media_info(post, access_token):
             media_info["media_type"] = "article_thumbnail"
             media_info["thumbnail_urn"] = thumbnail_urn
             # Fetch thumbnail URL
-            image_details = get_image_details(thumbnail_urn, access_token)
+            image_details = image_details_for(thumbnail_urn)
             if image_details:
                 media_info["image_url"] = image_details.get('downloadUrl')
     
@@ -144,143 +233,303 @@ def fetch_post_details(post_urn, access_token, cache):
     """Fetch and cache post details (used for reshare parents)"""
     if not post_urn:
         return None
-    if post_urn in cache:
-        return cache[post_urn]
+    cached = cache.get(f"post:{post_urn}")
+    if cached is not None:
+        return cached
 
     encoded_urn = quote(post_urn, safe='')
     url = f"{POSTS_API_BASE}/{encoded_urn}"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "X-Restli-Protocol-Version": "2.0.0",
-        "LinkedIn-Version": "202601"
-    }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = http.get(url, headers=api_headers(access_token))
         response.raise_for_status()
         data = response.json()
-        cache[post_urn] = data
+        cache.set(f"post:{post_urn}", data)
         return data
     except Exception as e:
         print(f"Error fetching parent post {post_urn}: {e}")
         return None
 
-# Fetch posts
-url = "https://api.linkedin.com/rest/posts"
-params = {
-    "author": f"urn:li:organization:{ORGANIZATION_ID}",
-    "q": "author",
-    "count": 20,
-    "sortBy": "CREATED"
-}
-
-headers = {
-    "Authorization": f"Bearer {ACCESS_TOKEN}",
-    "X-Restli-Protocol-Version": "2.0.0",
-    "LinkedIn-Version": "202601"
-}
-
-try:
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    
-    data = response.json()
-
-    # Debug: Show API response metadata
-    print("=== API Response Debug ===")
-    print(f"Total elements returned: {len(data.get('elements', []))}")
-    paging = data.get('paging', {})
-    print(f"Paging info: start={paging.get('start')}, count={paging.get('count')}, links={paging.get('links', [])}")
-
-    # Show first 3 post IDs and dates
-    from datetime import datetime
-    for i, p in enumerate(data.get('elements', [])[:3]):
-        ts = p.get('createdAt', 0) / 1000
-        dt = datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')
-        print(f"  Post {i+1}: {p.get('id')} | created: {dt}")
-    print("")
 
-    print("=== Processing Organization Posts ===\n")
-    
-    # Enhanced posts data with image URLs and shareable links
-    enhanced_posts = []
-    post_cache = {}
-    
-    for i, post in enumerate(data.get('elements', []), 1):
-        post_id = post.get('id')
-        post_url = get_post_url(post_id)
-        commentary = post.get('commentary', 'No text')
-        published_at = post.get('publishedAt')
-        
-        print(f"Processing Post {i}/{len(data.get('elements', []))}...")
-        
-        # Extract media info
-        media_info = extract_media_info(post, ACCESS_TOKEN)
-
-        reshare_context = post.get('reshareContext')
-        if (not media_info["has_media"]) and reshare_context:
-            parent_urn = reshare_context.get('parent') or reshare_context.get('root')
-            parent_post = fetch_post_details(parent_urn, ACCESS_TOKEN, post_cache)
-            if parent_post:
-                parent_media = extract_media_info(parent_post, ACCESS_TOKEN)
-                if parent_media["has_media"]:
-                    parent_media["source"] = "reshare_parent"
-                    media_info = parent_media
-
-        # Download image locally if available
+def load_existing():
+    """The current output file ({} when missing or unreadable)"""
+    if not OUTPUT_FILE.exists():
+        return {}
+    try:
+        with OUTPUT_FILE.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def post_created_at(post):
+    """createdAt of an output entry, from its raw post or published_at"""
+    original = post.get('original_data') or {}
+    return original.get('createdAt') or post.get('published_at') or 0
+
+
+def sync_cursor(posts):
+    """High-water mark: the newest post id and its createdAt"""
+    if not posts:
+        return None
+    newest = max(posts, key=post_created_at)
+    return {"newest_id": newest['post_id'], "newest_created_at": post_created_at(newest)}
+
+
+def fetch_new_posts(access_token, known_ids, cursor, page_size, full=False):
+    """Page backwards from the newest post and return the raw posts not seen yet.
+
+    Stops at the first post whose id is known or whose createdAt is at or
+    below the cursor, so a quiet day costs one request. With ``full`` every
+    page is read and every post returned.
+    """
+    params = {
+        "author": f"urn:li:organization:{ORGANIZATION_ID}",
+        "q": "author",
+        "count": page_size,
+        "sortBy": "CREATED"
+    }
+    high_water = (cursor or {}).get("newest_created_at") or 0
+    new_posts = []
+    start = 0
+    pages = 0
+
+    while True:
+        response = http.get(POSTS_API_BASE, headers=api_headers(access_token), params={**params, "start": start})
+        response.raise_for_status()
+        data = response.json()
+        elements = data.get('elements', [])
+        paging = data.get('paging', {})
+        pages += 1
+        print(f"  Page {pages}: start={start}, {len(elements)} post(s), links={paging.get('links', [])}")
+
+        for post in elements:
+            if not full and (post.get('id') in known_ids or (post.get('createdAt') or 0) <= high_water):
+                print(f"  Reached known post {post.get('id')}; stopping.")
+                return new_posts, pages
+            new_posts.append(post)
+
+        has_next = any(link.get('rel') == 'next' for link in paging.get('links', []))
+        if not elements or (not has_next and len(elements) < page_size):
+            return new_posts, pages
+        start += len(elements)
+
+
+def image_urns(post):
+    """Image URNs ``extract_media_info`` will look up for ``post``, in order"""
+    urns = []
+    extract_media_info(post, lambda urn: urns.append(urn))
+    return urns
+
+
+def reshare_parent_urn(post):
+    """Parent URN to take media from: set only for reshares without their own media"""
+    reshare_context = post.get('reshareContext')
+    if not reshare_context or extract_media_info(post, lambda urn: None)["has_media"]:
+        return None
+    return reshare_context.get('parent') or reshare_context.get('root')
+
+
+def run_stage(name, func, items, workers):
+    """Call ``func`` on each item with up to ``workers`` threads; results keep item order"""
+    items = list(items)
+    started = time.perf_counter()
+    if workers <= 1 or len(items) <= 1:
+        results = [func(item) for item in items]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(func, items))
+    print(f"[stage] {name}: {len(items)} item(s) in {time.perf_counter() - started:.2f}s")
+    return results
+
+
+def build_post(post, media_info, parent_urn):
+    """Output entry for one post from its resolved media"""
+    post_id = post.get('id')
+    reshare_context = post.get('reshareContext')
+
+    # Create enhanced post object
+    enhanced_post = {
+        "post_id": post_id,
+        "post_url": get_post_url(post_id),
+        "published_at": post.get('publishedAt'),
+        "commentary": post.get('commentary', 'No text'),
+        "lifecycle_state": post.get('lifecycleState'),
+        "visibility": post.get('visibility'),
+        "media": media_info,
+        "original_data": post  # Keep original post data
+    }
+
+    if reshare_context:
+        enhanced_post["reshare_parent_id"] = reshare_context.get('parent')
+        enhanced_post["reshare_root_id"] = reshare_context.get('root')
+        if media_info.get("source") == "reshare_parent":
+            enhanced_post["resolved_media_parent_id"] = parent_urn
+    return enhanced_post
+
+
+def print_post_summary(enhanced_post):
+    media_info = enhanced_post["media"]
+    print(f"  ✓ ID: {enhanced_post['post_id']}")
+    print(f"  ✓ URL: {enhanced_post['post_url']}")
+    if media_info["has_media"]:
+        print(f"  ✓ Media Type: {media_info['media_type']}")
+        if media_info["image_url"]:
+            print(f"  ✓ Image URL: {media_info['image_url'][:60]}...")
+        if media_info.get("source") == "reshare_parent":
+            print("  ✓ Media sourced from parent reshare")
+    print()
+
+
+def media_cache_key(post):
+    """Resolved media are reused until the post is edited"""
+    return f"media:{post.get('id')}:{post.get('lastModifiedAt') or post.get('createdAt')}"
+
+
+def cached_media(post, cache):
+    """``(media_info, parent_urn)`` from an earlier run, if its image is still on disk"""
+    entry = cache.get(media_cache_key(post))
+    if not entry:
+        return None
+    local_path = entry["media"].get("local_image_path")
+    if local_path and not (IMAGES_DIR / Path(local_path).name).exists():
+        return None
+    return copy.deepcopy(entry["media"]), entry.get("parent_urn")
+
+
+def resolve_media(posts, access_token, cache, workers, batch_size):
+    """Media info and reshare parent URN per post, via the three fetch stages"""
+    # Stage 1: reshare parents of posts without media of their own
+    parent_urns = [reshare_parent_urn(post) for post in posts]
+    unique_parents = list(dict.fromkeys(urn for urn in parent_urns if urn))
+    fetched = run_stage(
+        "reshare parents", lambda urn: fetch_post_details(urn, access_token, cache), unique_parents, workers
+    )
+    parents_by_urn = dict(zip(unique_parents, fetched))
+    parents = [parents_by_urn.get(urn) if urn else None for urn in parent_urns]
+
+    # Stage 2: image details for every image URN of the posts and their parents
+    sources = list(posts) + [parent for parent in parents if parent]
+    urns = [urn for source in sources for urn in image_urns(source)]
+    details = resolve_image_details(urns, access_token, cache, batch_size=batch_size, workers=workers)
+
+    media_infos = []
+    for post, parent in zip(posts, parents):
+        media_info = extract_media_info(post, details.get)
+        if parent:
+            parent_media = extract_media_info(parent, details.get)
+            if parent_media["has_media"]:
+                parent_media["source"] = "reshare_parent"
+                media_info = parent_media
+        media_infos.append(media_info)
+
+    # Stage 3: download images locally
+    downloads = [
+        (post.get('id'), media_info["image_url"])
+        for post, media_info in zip(posts, media_infos)
+        if media_info["has_media"] and media_info["image_url"]
+    ]
+    images = iter(run_stage("downloads", lambda item: download_image(item[1], item[0]), downloads, workers))
+    for post, media_info, parent_urn, parent in zip(posts, media_infos, parent_urns, parents):
         if media_info["has_media"] and media_info["image_url"]:
-            local_path = download_image(media_info["image_url"], post_id)
-            if local_path:
-                media_info["local_image_path"] = local_path
-                # Keep original URL for reference but prefer local path
-                media_info["original_image_url"] = media_info["image_url"]
-                media_info["image_url"] = local_path
-
-        # Create enhanced post object
-        enhanced_post = {
-            "post_id": post_id,
-            "post_url": post_url,
-            "published_at": published_at,
-            "commentary": commentary,
-            "lifecycle_state": post.get('lifecycleState'),
-            "visibility": post.get('visibility'),
-            "media": media_info,
-            "original_data": post  # Keep original post data
-        }
-
-        if reshare_context:
-            enhanced_post["reshare_parent_id"] = reshare_context.get('parent')
-            enhanced_post["reshare_root_id"] = reshare_context.get('root')
-            if media_info.get("source") == "reshare_parent":
-                enhanced_post["resolved_media_parent_id"] = parent_urn
-        
+            fields = next(images)
+            if not fields:
+                continue  # not cached, so the next run retries the download
+            # Keep original URL for reference but prefer the local derivative
+            media_info["original_image_url"] = media_info["image_url"]
+            apply_image_fields(media_info, fields)
+        elif media_info["has_media"] or (parent_urn and parent is None):
+            continue  # image details or reshare parent lookup failed; retried next run
+        cache.set(media_cache_key(post), {"media": copy.deepcopy(media_info), "parent_urn": parent_urn})
+    return media_infos, parent_urns
+
+
+def process_posts(posts, access_token, cache, workers=WORKERS, batch_size=IMAGE_BATCH_SIZE):
+    """Resolve media, download images and build output entries for ``posts``.
+
+    Posts whose media an earlier run resolved (same ``lastModifiedAt``, image
+    still on disk) are taken from ``cache`` without any request. The rest go
+    through three stages, each with up to ``workers`` concurrent requests:
+    reshare parents, image details (deduplicated across posts and fetched in
+    batches of ``batch_size``), image downloads. Entries come back in the
+    order of ``posts`` and match what processing the posts one by one would
+    produce.
+    """
+    resolved = [cached_media(post, cache) for post in posts]
+    pending = [post for post, hit in zip(posts, resolved) if hit is None]
+    print(f"[cache] {len(posts) - len(pending)} of {len(posts)} post(s) resolved from the cache")
+    if pending:
+        fresh = iter(zip(*resolve_media(pending, access_token, cache, workers, batch_size)))
+        resolved = [hit if hit is not None else next(fresh) for hit in resolved]
+
+    print()
+    enhanced_posts = []
+    for i, (post, (media_info, parent_urn)) in enumerate(zip(posts, resolved), 1):
+        enhanced_post = build_post(post, media_info, parent_urn)
+        print(f"Post {i}/{len(posts)}:")
+        print_post_summary(enhanced_post)
         enhanced_posts.append(enhanced_post)
-        
-        # Print summary
-        print(f"  ✓ ID: {post_id}")
-        print(f"  ✓ URL: {post_url}")
-        if media_info["has_media"]:
-            print(f"  ✓ Media Type: {media_info['media_type']}")
-            if media_info["image_url"]:
-                print(f"  ✓ Image URL: {media_info['image_url'][:60]}...")
-            if media_info.get("source") == "reshare_parent":
-                print("  ✓ Media sourced from parent reshare")
-        print()
-    
-    # Merge with existing posts to preserve history
-    existing_posts = []
-    if OUTPUT_FILE.exists():
-        try:
-            with OUTPUT_FILE.open('r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                existing_posts = existing_data.get('posts', [])
-        except (json.JSONDecodeError, KeyError):
-            existing_posts = []
+    return enhanced_posts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch organization posts from LinkedIn.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Backfill: read every page and reprocess every post instead of stopping at the cursor",
+    )
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE, help="Posts per API page")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKERS,
+        help="Concurrent requests per stage (1 processes everything sequentially)",
+    )
+    parser.add_argument(
+        "--image-batch-size",
+        type=int,
+        default=IMAGE_BATCH_SIZE,
+        help="Image URNs per Images API batch request (1 uses single gets)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Neither read nor write {CACHE_FILE}",
+    )
+    args = parser.parse_args()
+
+    existing_data = load_existing()
+    existing_posts = existing_data.get('posts', [])
+    known_ids = {p['post_id'] for p in existing_posts}
+    cursor = existing_data.get('sync') or sync_cursor(existing_posts)
+
+    mode = "full backfill" if args.full else f"incremental since {(cursor or {}).get('newest_id', 'the beginning')}"
+    print(f"=== Fetching Organization Posts ({mode}) ===\n")
+    new_posts, pages = fetch_new_posts(ACCESS_TOKEN, known_ids, cursor, args.page_size, full=args.full)
+    print(f"  {len(new_posts)} post(s) to process from {pages} page(s)\n")
+
+    if not new_posts:
+        print("No new posts; leaving the output file untouched.")
+        return
+
+    print("=== Processing Organization Posts ===\n")
+
+    # Enhanced posts data with image URLs and shareable links
+    cache = JsonCache(CACHE_FILE, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, enabled=not args.no_cache).load()
+    try:
+        enhanced_posts = process_posts(
+            new_posts, ACCESS_TOKEN, cache, workers=args.workers, batch_size=args.image_batch_size
+        )
+    finally:
+        cache.save()
+        cache.report()
 
     # Create a dict of new posts by ID for quick lookup
     new_posts_by_id = {p['post_id']: p for p in enhanced_posts}
 
-    # Keep existing posts that aren't in the new fetch (they rotated out)
+    # Keep existing posts that weren't fetched again (older than the cursor)
     for old_post in existing_posts:
         if old_post['post_id'] not in new_posts_by_id:
             enhanced_posts.append(old_post)
@@ -296,20 +545,30 @@ try:
         "total_posts": len(enhanced_posts),
         "posts_with_media": sum(1 for p in enhanced_posts if p['media']['has_media']),
         "posts_with_images": sum(1 for p in enhanced_posts if p['media']['image_url']),
+        "sync": sync_cursor(enhanced_posts),
         "posts": enhanced_posts
     }
-    
+
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     with OUTPUT_FILE.open('w', encoding='utf-8') as f:
         json.dump(output_data, f, indent=2, ensure_ascii=False)
-    
+
+    feed_written = write_feed(output_data)
+
     print("=" * 50)
     print(f"✓ Saved {len(enhanced_posts)} posts to {OUTPUT_FILE}")
+    print(f"  - Display feed files rewritten: {feed_written}")
     print(f"  - Posts with media: {output_data['posts_with_media']}")
     print(f"  - Posts with images: {output_data['posts_with_images']}")
-        
-except requests.exceptions.HTTPError as e:
-    print(f"HTTP Error: {e}")
-    print(f"Response: {response.text}")
-except requests.exceptions.RequestException as e:
-    print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except requests.exceptions.HTTPError as e:
+        print(f"HTTP Error: {e}")
+        print(f"Response: {e.response.text if e.response is not None else ''}")
+    except requests.exceptions.RequestException as e:
+        print(f"Error: {e}")
+    finally:
+        http.report()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Normalized paper storage for `public/content/papers/`.
+
+A paper linked to several milestones is stored once:
+
+- `store.json`: every paper keyed by tracker id (or DOI when there is no
+  id). The default layout is `{"layout": "rows", "papers": {key: record}}`;
+  `--columnar` writes `{"layout": "columns", "keys": [...], "columns":
+  {field: [...]}}` instead, which drops the repeated field names.
+- `<milestone>.json`: name, slug, count, `fetched_at` and the ordered `ids`.
+- `index.json`: the milestones with their counts, and the paper total.
+- `facets.json`: per publication year, `publication_type`, `journal` and
+  normalized author, the paper count and id list. Ids are in store order
+  (newest first), so any filter is the intersection of a few lists and
+  needs no paper records.
+
+`fetch_papers.py` writes this layout directly. Running this module rewrites
+existing files (including the old layout, where each milestone held full
+paper records) into it and reports the size change, without contacting the
+tracker. The readers here accept both layouts, so the build scripts work on
+either.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+PAPERS_DIR = ROOT_DIR / "public" / "content" / "papers"
+STORE_NAME = "store.json"
+INDEX_NAME = "index.json"
+FACETS_NAME = "facets.json"
+# Files in the papers directory that are not milestones.
+RESERVED_NAMES = (STORE_NAME, INDEX_NAME, FACETS_NAME)
+FACETS = ("year", "publication_type", "journal", "author")
+PAPER_FIELDS = (
+    "id",
+    "doi",
+    "title",
+    "author_name",
+    "journal",
+    "date",
+    "url",
+    "publication_type",
+    "additional_authors",
+)
+# Top-level fields that change on every fetch without the data changing.
+VOLATILE_FIELDS = ("fetched_at",)
+
+RE_NON_WORD = re.compile(r"[^a-z\s-]+")
+RE_SPACE = re.compile(r"[\s-]+")
+
+
+def paper_key(paper: Dict[str, Any]) -> Optional[str]:
+    """Store key: the tracker id, else the DOI, else None."""
+    if paper.get("id") is not None:
+        return str(paper["id"])
+    if paper.get("doi"):
+        return f"doi:{paper['doi']}"
+    return None
+
+
+def normalize_name(name: str) -> str:
+    """`"Roupé, Mattias"` -> `"mattias roupe"`; `"A. Logg"` -> `"a logg"`."""
+    if "," in name:
+        last, _, first = name.partition(",")
+        name = f"{first} {last}"
+    decomposed = unicodedata.normalize("NFKD", name.lower())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return RE_SPACE.sub(" ", RE_NON_WORD.sub(" ", stripped)).strip()
+
+
+def paper_record(paper: Dict[str, Any]) -> Dict[str, Any]:
+    record = {field: paper.get(field) for field in PAPER_FIELDS}
+    record["additional_authors"] = paper.get("additional_authors") or []
+    return record
+
+
+def encode_store(records: Dict[str, Dict[str, Any]], columnar: bool = False) -> Dict[str, Any]:
+    keys = sorted(records, key=lambda key: (str(records[key].get("date") or ""), key), reverse=True)
+    if not columnar:
+        return {"layout": "rows", "count": len(keys), "papers": {key: records[key] for key in keys}}
+    return {
+        "layout": "columns",
+        "count": len(keys),
+        "keys": keys,
+        "columns": {field: [records[key].get(field) for key in keys] for field in PAPER_FIELDS},
+    }
+
+
+def decode_store(payload: Any) -> Dict[str, Dict[str, Any]]:
+    """Return ``{key: record}`` from either store layout."""
+    if not isinstance(payload, dict):
+        return {}
+    if payload.get("layout") == "columns":
+        keys = payload.get("keys") or []
+        columns = payload.get("columns") or {}
+        return {
+            key: {field: (columns.get(field) or [None] * len(keys))[row] for field in PAPER_FIELDS}
+            for row, key in enumerate(keys)
+        }
+    papers = payload.get("papers")
+    return dict(papers) if isinstance(papers, dict) else {}
+
+
+def _facet_values(record: Dict[str, Any]) -> Dict[str, List[Tuple[str, str]]]:
+    """``{facet: [(value, label), ...]}`` for one paper; blanks are skipped."""
+    date = str(record.get("date") or "")
+    values: Dict[str, List[Tuple[str, str]]] = {
+        "year": [(date[:4], date[:4])] if date[:4].isdigit() else [],
+    }
+    for field in ("publication_type", "journal"):
+        text = " ".join(str(record.get(field) or "").split())
+        values[field] = [(text, text)] if text else []
+    authors = []
+    for name in [record.get("author_name"), *(record.get("additional_authors") or [])]:
+        if isinstance(name, str) and normalize_name(name):
+            authors.append((normalize_name(name), " ".join(name.split())))
+    values["author"] = authors
+    return values
+
+
+def build_facets(records: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Facet index: ``{"ids": [...], "facets": {facet: {value: {"count", "ids"}}}}``.
+
+    The top-level ``ids`` list every paper; all id lists follow the store
+    order, so filtered results keep it. Values are ordered by count then value.
+    Author values are ``normalize_name`` keys with a ``label`` holding the
+    most common spelling of that name.
+    """
+    order = encode_store(records)["papers"]
+    buckets: Dict[str, Dict[str, Dict[str, Any]]] = {facet: {} for facet in FACETS}
+    for key in order:
+        for facet, pairs in _facet_values(records[key]).items():
+            for value, label in pairs:
+                bucket = buckets[facet].setdefault(value, {"ids": [], "labels": {}})
+                if not bucket["ids"] or bucket["ids"][-1] != key:
+                    bucket["ids"].append(key)
+                bucket["labels"][label] = bucket["labels"].get(label, 0) + 1
+
+    facets: Dict[str, Dict[str, Any]] = {}
+    for facet, values in buckets.items():
+        ranked = sorted(values.items(), key=lambda item: (-len(item[1]["ids"]), item[0]))
+        facets[facet] = {}
+        for value, bucket in ranked:
+            entry: Dict[str, Any] = {"count": len(bucket["ids"]), "ids": bucket["ids"]}
+            label = max(bucket["labels"], key=lambda label: (bucket["labels"][label], label))
+            if label != value:
+                entry["label"] = label
+            facets[facet][value] = entry
+    return {"count": len(order), "ids": list(order), "facets": facets}
+
+
+def _read(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def milestone_paths(papers_dir: Path) -> List[Path]:
+    if not papers_dir.is_dir():
+        return []
+    return sorted(
+        path
+        for path in papers_dir.glob("*.json")
+        if path.name not in RESERVED_NAMES and not path.name.startswith(".")
+    )
+
+
+def load_papers(papers_dir: Path) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Return ``(records by key, milestones)`` from either layout.
+
+    Each milestone is its file's payload with ``ids`` filled in; papers that
+    only appear inline in old-layout files are added to the records.
+    """
+    records = decode_store(_read(papers_dir / STORE_NAME))
+    milestones: List[Dict[str, Any]] = []
+    for path in milestone_paths(papers_dir):
+        payload = _read(path)
+        if not isinstance(payload, dict):
+            continue
+        ids = list(payload.get("ids") or [])
+        for paper in payload.get("papers") or []:
+            if not isinstance(paper, dict):
+                continue
+            key = paper_key(paper)
+            if key is None:
+                continue
+            records.setdefault(key, paper_record(paper))
+            ids.append(key)
+        milestone = {k: v for k, v in payload.items() if k != "papers"}
+        milestone["slug"] = payload.get("slug") or path.stem
+        milestone["ids"] = list(dict.fromkeys(ids))
+        milestones.append(milestone)
+    return records, milestones
+
+
+def milestone_papers(papers_dir: Path, slug: str) -> List[Dict[str, Any]]:
+    """The ordered paper records of one milestone (empty when unknown)."""
+    records, milestones = load_papers(papers_dir)
+    for milestone in milestones:
+        if milestone["slug"] == slug:
+            return [records[key] for key in milestone["ids"] if key in records]
+    return []
+
+
+def content_hash(payload: Any) -> str:
+    """Hash of a JSON payload, ignoring ``VOLATILE_FIELDS`` at the top level."""
+    if isinstance(payload, dict):
+        payload = {k: v for k, v in payload.items() if k not in VOLATILE_FIELDS}
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def write_json_if_changed(path: Path, payload: Any, *, compact: bool = False) -> bool:
+    """Write ``payload`` unless the file already holds the same content."""
+    existing = _read(path)
+    if existing is not None and content_hash(existing) == content_hash(payload):
+        return False
+    layout = {"separators": (",", ":")} if compact else {"indent": 2}
+    path.write_text(json.dumps(payload, ensure_ascii=False, **layout) + "\n", encoding="utf-8")
+    return True
+
+
+def write_layout(
+    papers_dir: Path,
+    milestones: Iterable[Dict[str, Any]],
+    records: Dict[str, Dict[str, Any]],
+    *,
+    columnar: bool = False,
+) -> List[str]:
+    """Write the store, milestone files, index and facets; returns changed names.
+
+    ``milestones`` are dicts with ``name``, ``slug``, ``count``,
+    ``fetched_at`` and ``ids``. Only papers some milestone lists are stored.
+    A milestone whose file name would be one of ``RESERVED_NAMES`` is skipped.
+    """
+    papers_dir.mkdir(parents=True, exist_ok=True)
+    kept = []
+    for milestone in milestones:
+        if f"{milestone['slug']}.json" in RESERVED_NAMES:
+            print(f"[papers] Skipped milestone '{milestone['slug']}': {milestone['slug']}.json is reserved")
+            continue
+        kept.append(milestone)
+    milestones = kept
+    listed = {key for milestone in milestones for key in milestone["ids"]}
+    changed: List[str] = []
+
+    store = encode_store({key: records[key] for key in listed if key in records}, columnar)
+    if write_json_if_changed(papers_dir / STORE_NAME, store):
+        changed.append(STORE_NAME)
+
+    for milestone in milestones:
+        payload = {
+            "name": milestone.get("name"),
+            "slug": milestone["slug"],
+            "count": milestone.get("count", len(milestone["ids"])),
+            "fetched_at": milestone.get("fetched_at"),
+            "ids": milestone["ids"],
+        }
+        name = f"{milestone['slug']}.json"
+        if write_json_if_changed(papers_dir / name, payload):
+            changed.append(name)
+
+    index = {
+        "count": store["count"],
+        "store": STORE_NAME,
+        "milestones": [
+            {"name": m.get("name"), "slug": m["slug"], "count": len(m["ids"])}
+            for m in sorted(milestones, key=lambda m: m["slug"])
+        ],
+    }
+    if write_json_if_changed(papers_dir / INDEX_NAME, index):
+        changed.append(INDEX_NAME)
+
+    # Fetched up front by list pages, so it is written without indentation.
+    facets = build_facets(decode_store(store))
+    if write_json_if_changed(papers_dir / FACETS_NAME, facets, compact=True):
+        changed.append(FACETS_NAME)
+    return changed
+
+
+def _total_bytes(papers_dir: Path) -> int:
+    return sum(path.stat().st_size for path in papers_dir.glob("*.json"))
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Rewrite papers/ into the normalized store layout.")
+    parser.add_argument("--papers-dir", type=Path, default=PAPERS_DIR)
+    parser.add_argument("--columnar", action="store_true", help="Write store.json in the columnar layout")
+    args = parser.parse_args(argv)
+
+    before = _total_bytes(args.papers_dir)
+    records, milestones = load_papers(args.papers_dir)
+    links = sum(len(m["ids"]) for m in milestones)
+    changed = write_layout(args.papers_dir, milestones, records, columnar=args.columnar)
+    after = _total_bytes(args.papers_dir)
+
+    print(f"[papers] {len(records)} unique papers across {len(milestones)} milestones ({links} links).")
+    print(f"[papers] Rewrote {len(changed)} file(s); {before} -> {after} bytes ({after - before:+d}).")
+
+
+if __name__ == "__main__":
+    main()
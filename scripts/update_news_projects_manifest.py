@@ -1,34 +1,121 @@
 #!/usr/bin/env python3
 """
-Regenerate content manifests for runtime news and projects entries.
+Regenerate content manifests for runtime news, projects, events, dtcc-1 and
+gallery entries.
 
 Each section scans `public/content/<section>/*.json`, rebuilds the matching
-`index.json`, and preserves existing manifest extras (images, order, etc.).
-New entries are reported in the console so CI logs stay informative.
+`index.json` with the card fields list views render, and preserves existing
+manifest extras (images, order, etc.). The manifest's pages, the events date
+splits and the fingerprinted copies listed in `version.json` are refreshed
+alongside. New entries are reported in the console so CI logs stay informative.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
-from datetime import date
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - Python < 3.9
+    ZoneInfo = None  # type: ignore[assignment]
+
+from image_metadata import IMAGE_EXTENSIONS, placeholder_data_uri, probe_image
 
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 CONTENT_ROOT = ROOT_DIR / "public" / "content"
-
+CACHE_PATH = ROOT_DIR / ".cache" / "content-manifest.json"
+CACHE_VERSION = 4
+# Below this many files a pool costs more to start than it saves.
+PARALLEL_MIN_FILES = 256
+DEFAULT_JOBS = os.cpu_count() or 1
+
+# `key` is the slug field the section's readers expect. `order` is either
+# "date" (newest first) or "manifest" (keep the existing order, append new
+# entries). `card_extras` are copied verbatim when present.
 SECTION_SETTINGS: Dict[str, Dict[str, Any]] = {
     "news": {
         "dir": "news",
+        "key": "base",
+        "order": "date",
         "date_fields": ("date", "published", "publishedAt", "time"),
+        "card_extras": ("eyebrow", "order"),
     },
     "projects": {
         "dir": "projects",
+        "key": "base",
+        "order": "date",
         "date_fields": ("date", "published", "publishedAt", "updated"),
+        "card_extras": ("order",),
+    },
+    "events": {
+        "dir": "events",
+        "key": "id",
+        "order": "manifest",
+        "date_fields": ("date",),
+        "card_extras": ("timeStart", "timeEnd", "location", "meta"),
+    },
+    "dtcc-1": {
+        "dir": "dtcc-1",
+        "key": "id",
+        "order": "manifest",
+        "date_fields": ("date", "published", "updated"),
+        "card_extras": ("order",),
+    },
+    "gallery": {
+        "dir": "gallery",
+        "key": "base",
+        "order": "manifest",
+        "date_fields": ("date",),
+        "card_extras": (),
     },
 }
 
+EVENTS_SECTION = "events"
+# Events are local to Gothenburg; "today" flips at midnight there.
+EVENTS_TIMEZONE = "Europe/Stockholm"
+
+WATCH_DEBOUNCE = 0.3
+WATCH_INTERVAL = 1.0
+
+PAGE_SIZE = 12
+PAGES_HEAD = "index.pages.json"
+FINGERPRINT_LENGTH = 12
+FINGERPRINTS_KEPT = 2
+
+RE_FINGERPRINT = re.compile(r"^index\.[0-9a-f]+\.json$")
+
+SUMMARY_FIELDS = ("summary", "excerpt", "abstract", "intro")
+SLUG_KEYS = ("base", "id", "slug")
+
+
+def is_content_file(name: str) -> bool:
+    """Content documents are `*.json` files other than the generated `index*.json`.
+
+    Dotfiles are skipped too: editors and atomic writers use names such as
+    `.#item.json` or `.item.json.tmp` for locks and in-progress saves.
+    """
+    return (
+        name.endswith(".json")
+        and not name.startswith(".")
+        and not (name == "index.json" or name.startswith("index."))
+    )
+
 
 def load_existing_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
     if not path.exists():
@@ -57,17 +144,300 @@ def load_existing_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
         )
         if not isinstance(slug, str) or not slug:
             continue
-        result[slug] = {k: v for k, v in item.items() if k != "base"}
+        result[slug] = {k: v for k, v in item.items() if k not in SLUG_KEYS}
     return result
 
 
-def load_content_items(dir_path: Path) -> Iterable[Tuple[str, Dict[str, Any]]]:
-    for path in sorted(dir_path.glob("*.json")):
-        if path.name == "index.json":
+def load_cache(path: Path) -> Dict[str, Any]:
+    """Per-file card fields from earlier runs (`--full` ignores them)."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return {"version": CACHE_VERSION, "sections": {}}
+    if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+        return {"version": CACHE_VERSION, "sections": {}}
+    payload.setdefault("sections", {})
+    return payload
+
+
+def save_cache(path: Path, cache: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(cache, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def file_stamp(path: Path) -> Optional[List[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def loads_json(raw: bytes) -> Any:
+    """Decode with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def map_files(fn: Callable[..., Any], jobs: int, *iterables: Sequence[Any]) -> List[Any]:
+    """``map`` over file work items, fanned out to processes when worthwhile.
+
+    Results come back in input order, so output stays deterministic.
+    """
+    count = len(iterables[0]) if iterables else 0
+    if jobs <= 1 or count < PARALLEL_MIN_FILES:
+        return list(map(fn, *iterables))
+    workers = min(jobs, count)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, *iterables, chunksize=max(1, count // (workers * 8))))
+
+
+def _text(payload: Dict[str, Any], *keys: str) -> Optional[str]:
+    for key in keys:
+        value = payload.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
+
+def card_fields(payload: Dict[str, Any], settings: Dict[str, Any], record_date: date | None) -> Dict[str, Any]:
+    """Pick the fields a list card renders from a content document."""
+    card: Dict[str, Any] = {}
+    title = _text(payload, "title", "name")
+    if title:
+        card["title"] = title
+    if record_date:
+        card["date"] = record_date.isoformat()
+    summary = _text(payload, *SUMMARY_FIELDS)
+    if summary:
+        card["summary"] = summary
+    description = _text(payload, "description")
+    if description and description != summary:
+        card["description"] = description
+
+    image = _text(payload, "image")
+    if not image and isinstance(payload.get("images"), list):
+        image = next((i.strip() for i in payload["images"] if isinstance(i, str) and i.strip()), None)
+    if image:
+        card["image"] = image
+
+    url = _text(payload, "url", "link")
+    if url:
+        card["url"] = url
+    tags = payload.get("tags")
+    if isinstance(tags, list):
+        tags = [tag.strip() for tag in tags if isinstance(tag, str) and tag.strip()]
+        if tags:
+            card["tags"] = tags
+
+    for key in settings["card_extras"]:
+        value = payload.get(key)
+        if value not in (None, "", [], {}):
+            card[key] = value
+    return card
+
+
+def summarize_payload(payload: Dict[str, Any], section: str, slug: str) -> Dict[str, Any]:
+    """Reduce a content document to the fields the manifest is built from."""
+    settings = SECTION_SETTINGS[section]
+    record_date = parse_date(payload, settings["date_fields"])
+    title = str(payload.get("title") or payload.get("name") or slug).strip() or slug
+    return {
+        "date": record_date.isoformat() if record_date else None,
+        "title": title,
+        "card": card_fields(payload, settings, record_date),
+    }
+
+
+def read_summary(
+    path: str, section: str, known_sha1: Optional[str]
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Hash ``path`` and summarise it unless the hash equals ``known_sha1``.
+
+    Returns ``(None, None)`` for a file that cannot be read or parsed, such
+    as an editor's half-written save.
+    """
+    try:
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if digest == known_sha1:
+            return digest, None
+        payload = loads_json(raw)
+        if not isinstance(payload, dict):
+            raise ValueError("expected a JSON object")
+    except (OSError, ValueError) as exc:
+        print(f"[{section}] Skipped {path}: {exc}")
+        return None, None
+    slug = os.path.basename(path)[:-5]
+    return digest, summarize_payload(payload, section, slug)
+
+
+def scan_section(dir_path: Path) -> Tuple[List[Tuple[str, List[int]]], Dict[str, List[int]]]:
+    """Stat a section directory once: content files and image files with stamps."""
+    files: List[Tuple[str, List[int]]] = []
+    images: Dict[str, List[int]] = {}
+    # os.scandir keeps the warm path to one stat per file; sorting Path
+    # objects alone costs more than that on large sections.
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            name = entry.name
+            if is_content_file(name):
+                stat = entry.stat()
+                files.append((name, [stat.st_mtime_ns, stat.st_size]))
+            elif name.rsplit(".", 1)[-1].lower() in IMAGE_EXTENSIONS:
+                stat = entry.stat()
+                images[name] = [stat.st_mtime_ns, stat.st_size]
+    files.sort()
+    return files, images
+
+
+def load_content_summaries(
+    dir_path: Path,
+    section: str,
+    files: List[Tuple[str, List[int]]],
+    cached_files: Dict[str, Dict[str, Any]],
+    jobs: int = 1,
+) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, Dict[str, Any]], int]:
+    """Return ``(slug, summary)`` pairs, the refreshed cache and a parse count.
+
+    A cached summary is reused when the file's mtime and size match, or, when
+    they do not (fresh checkouts touch every mtime), when its SHA-1 does.
+    A file that fails to parse keeps its previous summary (or is left out)
+    and is read again on the next run.
+    """
+    results: List[Tuple[str, Dict[str, Any]]] = []
+    refreshed: Dict[str, Dict[str, Any]] = {}
+    parsed = 0
+
+    stamps = dict(files)
+    pending: List[str] = []
+    for name, stamp in files:
+        cached = cached_files.get(name)
+        if not cached or cached.get("stamp") != stamps[name]:
+            pending.append(name)
+
+    known = [(cached_files.get(name) or {}).get("sha1") for name in pending]
+    loaded = dict(
+        zip(
+            pending,
+            map_files(
+                read_summary,
+                jobs,
+                [str(dir_path / name) for name in pending],
+                [section] * len(pending),
+                known,
+            ),
+        )
+    )
+
+    for name, _ in files:
+        cached = cached_files.get(name)
+        if name not in loaded:
+            refreshed[name] = cached
+            results.append((name[:-5], cached["summary"]))
+            continue
+        digest, summary = loaded[name]
+        if digest is None:
+            if cached:
+                refreshed[name] = cached
+                results.append((name[:-5], cached["summary"]))
             continue
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        yield path.stem, data
+        if summary is None:
+            summary = cached["summary"]
+        else:
+            parsed += 1
+        refreshed[name] = {"stamp": stamps[name], "sha1": digest, "summary": summary}
+        results.append((name[:-5], summary))
+
+    return results, refreshed, parsed
+
+
+def local_image_path(ref: str, content_root: Path) -> Optional[Path]:
+    """Map a manifest image reference (`content/...` or `/content/...`) to a file."""
+    if "://" in ref or ref.startswith("data:"):
+        return None
+    relative = ref.split("?", 1)[0].split("#", 1)[0].lstrip("/")
+    if not relative.startswith(content_root.name + "/"):
+        return None
+    path = content_root.parent / relative
+    return path if path.is_file() else None
+
+
+def image_metadata(ref: str, path: Path) -> Optional[Dict[str, Any]]:
+    meta = probe_image(path)
+    if meta is None:
+        return None
+    stem_ref = ref.rsplit(".", 1)[0]
+    sources = {
+        ext: f"{stem_ref}.{ext}"
+        for ext in IMAGE_EXTENSIONS
+        if path.with_suffix(f".{ext}").is_file()
+    }
+    if sources:
+        meta["sources"] = sources
+    placeholder = placeholder_data_uri(path)
+    if placeholder:
+        meta["placeholder"] = placeholder
+    return meta
+
+
+def resolve_card_image(
+    card: Dict[str, Any],
+    extras: Dict[str, Any],
+    slug: str,
+    section_dir: str,
+    images: Dict[str, List[int]],
+    content_root: Path,
+    cached_images: Dict[str, Dict[str, Any]],
+    refreshed_images: Dict[str, Dict[str, Any]],
+) -> None:
+    """Fill in ``card["image"]``/``card["imageMeta"]`` from files on disk.
+
+    Entries without an image fall back to the first `<slug>.<ext>` found.
+    `imageMeta` holds the file's width, height and format, the other formats
+    available for it and (with Pillow) a tiny WebP placeholder, so cards can
+    reserve space without probing.
+    """
+    ref = card.get("image") or extras.get("image")
+    if not isinstance(ref, str) or not ref.strip():
+        found = next((f"{slug}.{ext}" for ext in IMAGE_EXTENSIONS if f"{slug}.{ext}" in images), None)
+        if found is None:
+            return
+        ref = card["image"] = f"{content_root.name}/{section_dir}/{found}"
+
+    path = local_image_path(ref, content_root)
+    if path is None:
+        return
+    stamp = file_stamp(path)
+    cached = cached_images.get(ref)
+    if cached and cached.get("stamp") == stamp:
+        meta = cached["meta"]
+    else:
+        meta = image_metadata(ref, path)
+    previous = extras.get("imageMeta")
+    if (
+        meta
+        and "placeholder" not in meta
+        and isinstance(previous, dict)
+        and previous.get("placeholder")
+        and (previous.get("width"), previous.get("height")) == (meta["width"], meta["height"])
+    ):
+        # Without Pillow no placeholder can be built; keep the one already published.
+        meta = {**meta, "placeholder": previous["placeholder"]}
+    refreshed_images[ref] = {"stamp": stamp, "meta": meta}
+    if meta:
+        card["imageMeta"] = meta
+
+
+def read_payload(path: str) -> Any:
+    with open(path, "rb") as fh:
+        return loads_json(fh.read())
 
 
 def parse_date(payload: Dict[str, Any], fields: Sequence[str]) -> date | None:
@@ -89,48 +459,251 @@ def build_manifest_entries(
     slug: str,
     payload: Dict[str, Any],
     existing_extras: Dict[str, Any],
+    key: str = "base",
 ) -> Dict[str, Any]:
-    entry: Dict[str, Any] = {"base": slug}
+    """Build a manifest entry from a summary's card fields plus manifest extras.
 
-    image = payload.get("image")
-    if isinstance(image, str) and image.strip():
-        entry["image"] = image.strip()
-    elif isinstance(existing_extras.get("image"), str) and existing_extras["image"].strip():
-        entry["image"] = existing_extras["image"].strip()
+    Card fields always reflect the content file; anything else already in the
+    manifest (an image override, `order`, ...) is carried over.
+    """
+    entry: Dict[str, Any] = {key: slug}
+    entry.update(payload.get("card", {}))
 
-    for key, value in existing_extras.items():
-        if key == "image":
-            continue
-        if key == "base":
+    for name, value in existing_extras.items():
+        if name in SLUG_KEYS:
             continue
-        if key not in entry and value not in (None, ""):
-            entry[key] = value
+        if name not in entry and value not in (None, ""):
+            entry[name] = value
 
     return entry
 
 
-def update_section(section: str) -> None:
+def write_if_changed(path: Path, rendered: str) -> bool:
+    if path.exists() and path.read_text(encoding="utf-8") == rendered:
+        return False
+    path.write_text(rendered, encoding="utf-8")
+    return True
+
+
+def write_pages(dir_path: Path, items: List[Dict[str, Any]], order: str, page_size: int) -> int:
+    """Write `index.page-<n>.json` shards and the `index.pages.json` head.
+
+    ``items`` is in display order. Date-ordered sections gain entries at the
+    front, so pages are cut from the oldest entry; manifest-ordered sections
+    append, so pages are cut from the first. Either way page 1 holds the
+    entries that never move and only the last page is open. The head lists
+    pages in display order, so list views (`src/utils/manifestPages.js`)
+    fetch the first listed page, and the next one while that is not full.
+    Returns the number of files rewritten.
+    """
+    growth = list(reversed(items)) if order == "date" else list(items)
+    chunks = [growth[start : start + page_size] for start in range(0, len(growth), page_size)]
+
+    written = 0
+    pages: List[Dict[str, Any]] = []
+    for number, chunk in enumerate(chunks, start=1):
+        page_items = list(reversed(chunk)) if order == "date" else chunk
+        name = f"index.page-{number}.json"
+        rendered = json.dumps({"page": number, "items": page_items}, ensure_ascii=False, indent=2) + "\n"
+        written += write_if_changed(dir_path / name, rendered)
+        pages.append({"file": name, "page": number, "count": len(chunk)})
+
+    if order == "date":
+        pages.reverse()
+
+    for stale in dir_path.glob("index.page-*.json"):
+        suffix = stale.stem.rsplit("-", 1)[-1]
+        if not suffix.isdigit() or int(suffix) > len(chunks):
+            stale.unlink()
+            written += 1
+
+    head = {"total": len(items), "pageSize": page_size, "pages": pages}
+    rendered = json.dumps(head, ensure_ascii=False, indent=2) + "\n"
+    written += write_if_changed(dir_path / PAGES_HEAD, rendered)
+    return written
+
+
+def events_today(tz_name: str = EVENTS_TIMEZONE) -> date:
+    if ZoneInfo is None:
+        return date.today()
+    try:
+        return datetime.now(ZoneInfo(tz_name)).date()
+    except Exception:  # missing tzdata
+        return date.today()
+
+
+def write_event_splits(dir_path: Path, today: date) -> int:
+    """Write the upcoming, per-year past and per-month event indexes.
+
+    Entries come from the section's `index.json`; undated entries are left
+    out. Returns the number of files rewritten.
+    """
+    key = SECTION_SETTINGS[EVENTS_SECTION]["key"]
+    manifest = load_existing_manifest(dir_path / "index.json")
+    dated: List[Tuple[date, str, Dict[str, Any]]] = []
+    for slug, extras in manifest.items():
+        entry = {key: slug, **extras}
+        try:
+            event_date = date.fromisoformat(str(entry.get("date", ""))[:10])
+        except ValueError:
+            continue
+        dated.append((event_date, str(entry.get("timeStart") or ""), entry))
+    dated.sort(key=lambda item: (item[0], item[1]))
+
+    upcoming = [entry for event_date, _, entry in dated if event_date >= today]
+    past_by_year: Dict[int, List[Dict[str, Any]]] = {}
+    for event_date, _, entry in reversed(dated):
+        if event_date < today:
+            past_by_year.setdefault(event_date.year, []).append(entry)
+    months: Dict[str, List[Dict[str, Any]]] = {}
+    for event_date, _, entry in dated:
+        months.setdefault(event_date.strftime("%Y-%m"), []).append(
+            {field: entry[field] for field in (key, "title", "date", "timeStart") if field in entry}
+        )
+
+    def render(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+
+    years = sorted(past_by_year, reverse=True)
+    written = write_if_changed(
+        dir_path / "index.upcoming.json", render({"items": upcoming, "pastYears": years})
+    )
+    for year in years:
+        written += write_if_changed(
+            dir_path / f"index.past-{year}.json", render({"year": year, "items": past_by_year[year]})
+        )
+    for stale in dir_path.glob("index.past-*.json"):
+        suffix = stale.stem.rsplit("-", 1)[-1]
+        if not suffix.isdigit() or int(suffix) not in past_by_year:
+            stale.unlink()
+            written += 1
+    calendar = [{"month": month, "count": len(entries), "items": entries} for month, entries in sorted(months.items())]
+    written += write_if_changed(dir_path / "index.months.json", render({"months": calendar}))
+    return written
+
+
+def refresh_event_splits(content_root: Path = CONTENT_ROOT, today: Optional[date] = None) -> None:
+    """Re-split events as of today in Stockholm.
+
+    Runs on every pass, content change or not, so the scheduled deploy just
+    after midnight moves finished events into the past.
+    """
+    dir_path = content_root / SECTION_SETTINGS[EVENTS_SECTION]["dir"]
+    if not (dir_path / "index.json").exists():
+        return
+    today = today or events_today()
+    written = write_event_splits(dir_path, today)
+    if written:
+        print(f"[{EVENTS_SECTION}] Rewrote {written} upcoming/past/calendar file(s) as of {today}.")
+
+
+def fingerprint_manifest(dir_path: Path) -> Optional[str]:
+    """Write `index.<hash>.json` for the section manifest; returns its name.
+
+    Hashed copies never change, so a CDN can serve them as `immutable`. The
+    current and previous copy are kept so pages holding a slightly stale
+    `version.json` still load. Both are build outputs and are not committed.
+    """
+    manifest_path = dir_path / "index.json"
+    try:
+        raw = manifest_path.read_bytes()
+    except FileNotFoundError:
+        return None
+    name = f"index.{hashlib.sha256(raw).hexdigest()[:FINGERPRINT_LENGTH]}.json"
+    target = dir_path / name
+    if not target.exists():
+        target.write_bytes(raw)
+    else:
+        # Touch so the pruning below treats it as the newest copy.
+        os.utime(target)
+
+    copies = sorted(
+        (path for path in dir_path.glob("index.*.json") if RE_FINGERPRINT.match(path.name)),
+        key=lambda path: path.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for stale in copies[FINGERPRINTS_KEPT:]:
+        if stale.name != name:
+            stale.unlink()
+    return name
+
+
+def write_version_file(content_root: Path = CONTENT_ROOT) -> bool:
+    """Refresh every section's hashed manifest and the `version.json` pointer."""
+    sections: Dict[str, str] = {}
+    for settings in SECTION_SETTINGS.values():
+        dir_path = content_root / settings["dir"]
+        if dir_path.is_dir():
+            name = fingerprint_manifest(dir_path)
+            if name:
+                sections[settings["dir"]] = name
+    rendered = json.dumps({"sections": sections}, ensure_ascii=False, indent=2) + "\n"
+    changed = write_if_changed(content_root / "version.json", rendered)
+    if changed:
+        print(f"[version] Updated {content_root / 'version.json'}")
+    return changed
+
+
+def update_section(
+    section: str,
+    *,
+    content_root: Path = CONTENT_ROOT,
+    cache: Optional[Dict[str, Any]] = None,
+    full: bool = False,
+    jobs: int = DEFAULT_JOBS,
+) -> None:
     settings = SECTION_SETTINGS[section]
-    dir_path = CONTENT_ROOT / settings["dir"]
+    dir_path = content_root / settings["dir"]
     manifest_path = dir_path / "index.json"
 
     if not dir_path.exists():
         print(f"[{section}] Skipped: missing directory {dir_path}")
         return
 
+    started = time.perf_counter()
+    section_cache = {} if cache is None else cache["sections"].setdefault(section, {})
+    cached_files = {} if full else section_cache.get("files", {})
+
+    files, images = scan_section(dir_path)
+    summaries, refreshed, parsed = load_content_summaries(
+        dir_path, section, files, cached_files, jobs
+    )
+    section_cache["files"] = refreshed
+    elapsed = time.perf_counter() - started
+
+    # Images referenced from outside the section directory are not tracked
+    # here; --full picks up changes to those.
+    images_digest = hashlib.sha1(json.dumps(sorted(images.items())).encode("utf-8")).hexdigest()
+    manifest_stamp = file_stamp(manifest_path)
+    if (
+        not full
+        and parsed == 0
+        and refreshed.keys() == cached_files.keys()
+        and manifest_stamp is not None
+        and section_cache.get("manifest") == manifest_stamp
+        and section_cache.get("images_digest") == images_digest
+    ):
+        print(f"[{section}] Manifest is up to date ({len(summaries)} cached, {elapsed:.3f}s).")
+        return
+
     existing_manifest = load_existing_manifest(manifest_path)
     records: List[Tuple[date | None, str, Dict[str, Any]]] = []
     added: List[Tuple[str, str]] = []
+    cached_images = {} if full else section_cache.get("images", {})
+    refreshed_images: Dict[str, Dict[str, Any]] = {}
 
-    for slug, payload in load_content_items(dir_path):
+    for slug, summary in summaries:
         extras = existing_manifest.get(slug, {})
-        entry = build_manifest_entries(slug, payload, extras)
+        card = dict(summary["card"])
+        resolve_card_image(
+            card, extras, slug, settings["dir"], images, content_root, cached_images, refreshed_images
+        )
+        entry = build_manifest_entries(slug, {**summary, "card": card}, extras, settings["key"])
 
-        title = str(payload.get("title") or payload.get("name") or slug).strip() or slug
         if slug not in existing_manifest:
-            added.append((slug, title))
+            added.append((slug, summary["title"]))
 
-        record_date = parse_date(payload, settings["date_fields"])
+        record_date = date.fromisoformat(summary["date"]) if summary["date"] else None
         records.append((record_date, slug, entry))
 
     def sort_key(item: Tuple[date | None, str, Dict[str, Any]]) -> Tuple[int, int, str]:
@@ -140,16 +713,29 @@ def update_section(section: str) -> None:
         return (1, 0, slug)
 
     records.sort(key=sort_key)
+    if settings["order"] == "manifest":
+        positions = {slug: position for position, slug in enumerate(existing_manifest)}
+        records.sort(key=lambda item: positions.get(item[1], len(positions)))
     manifest = {"items": [entry for _, _, entry in records]}
 
     rendered = json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"
     existing_text = manifest_path.read_text(encoding="utf-8") if manifest_path.exists() else ""
+    print(f"[{section}] Parsed {parsed} of {len(summaries)} files in {elapsed:.3f}s.")
+
+    section_cache["images"] = refreshed_images
+    section_cache["images_digest"] = images_digest
+
+    pages_written = write_pages(dir_path, manifest["items"], settings["order"], PAGE_SIZE)
+    if pages_written:
+        print(f"[{section}] Rewrote {pages_written} manifest page file(s).")
 
     if existing_text == rendered:
+        section_cache["manifest"] = manifest_stamp
         print(f"[{section}] Manifest is up to date.")
         return
 
     manifest_path.write_text(rendered, encoding="utf-8")
+    section_cache["manifest"] = file_stamp(manifest_path)
     print(f"[{section}] Updated {manifest_path}")
     if added:
         print(f"[{section}] New items added:")
@@ -157,9 +743,208 @@ def update_section(section: str) -> None:
             print(f"  - {slug}: {title}")
 
 
+def watched_section(path: Path, content_root: Path) -> Optional[str]:
+    """Return the section a changed path belongs to, or None to ignore it."""
+    try:
+        relative = path.relative_to(content_root)
+    except ValueError:
+        return None
+    if len(relative.parts) != 2:
+        return None
+    dir_name, name = relative.parts
+    # Skips the manifests we write, swap/backup files and other editor droppings.
+    if name.startswith(".") or not (
+        is_content_file(name) or name.rsplit(".", 1)[-1].lower() in IMAGE_EXTENSIONS
+    ):
+        return None
+    for section, settings in SECTION_SETTINGS.items():
+        if settings["dir"] == dir_name:
+            return section
+    return None
+
+
+class ChangeBatcher:
+    """Collect changed sections and hand them out once writes go quiet."""
+
+    def __init__(self, debounce: float) -> None:
+        self.debounce = debounce
+        self._pending: Dict[str, int] = {}
+        self._last_change = 0.0
+        self._cond = threading.Condition()
+
+    def add(self, section: str) -> None:
+        with self._cond:
+            self._pending[section] = self._pending.get(section, 0) + 1
+            self._last_change = time.monotonic()
+            self._cond.notify()
+
+    def wait(self, stop: threading.Event) -> Dict[str, int]:
+        """Block until a batch is ready; returns ``{section: event count}``."""
+        with self._cond:
+            while not stop.is_set():
+                if not self._pending:
+                    self._cond.wait(0.5)
+                    continue
+                remaining = self._last_change + self.debounce - time.monotonic()
+                if remaining <= 0:
+                    batch, self._pending = self._pending, {}
+                    return batch
+                self._cond.wait(remaining)
+        return {}
+
+
+def start_watcher(
+    content_root: Path, batcher: ChangeBatcher, interval: float
+) -> Callable[[], None]:
+    """Feed changed sections to ``batcher``; returns a callable that stops it."""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        Observer = None  # type: ignore[assignment]
+
+    if Observer is not None:
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):  # type: ignore[override]
+                if event.is_directory:
+                    return
+                # A rename reports both ends: moving a temp file over
+                # `item.json` counts for `item.json`, moving an item away
+                # counts as its removal.
+                for attr in ("src_path", "dest_path"):
+                    value = getattr(event, attr, None)
+                    section = watched_section(Path(os.fsdecode(value)), content_root) if value else None
+                    if section:
+                        batcher.add(section)
+
+        observer = Observer()
+        handler = _Handler()
+        for settings in SECTION_SETTINGS.values():
+            dir_path = content_root / settings["dir"]
+            if dir_path.is_dir():
+                observer.schedule(handler, str(dir_path), recursive=False)
+        observer.daemon = True
+        observer.start()
+        print(f"[watch] Watching {content_root} with {type(observer).__name__}.")
+
+        def stop_observer() -> None:
+            observer.stop()
+            observer.join(timeout=5)
+
+        return stop_observer
+
+    stop = threading.Event()
+
+    def snapshot(section: str) -> Tuple[Any, ...]:
+        dir_path = content_root / SECTION_SETTINGS[section]["dir"]
+        if not dir_path.is_dir():
+            return ()
+        files, images = scan_section(dir_path)
+        return tuple(files), tuple(sorted((name, tuple(stamp)) for name, stamp in images.items()))
+
+    def poll() -> None:
+        previous = {section: snapshot(section) for section in SECTION_SETTINGS}
+        while not stop.wait(interval):
+            for section in SECTION_SETTINGS:
+                current = snapshot(section)
+                if current != previous[section]:
+                    previous[section] = current
+                    batcher.add(section)
+
+    thread = threading.Thread(target=poll, name="manifest-poll", daemon=True)
+    thread.start()
+    print(f"[watch] Polling {content_root} every {interval:g}s (install watchdog for inotify).")
+    return stop.set
+
+
+def watch(
+    cache: Dict[str, Any],
+    *,
+    content_root: Path = CONTENT_ROOT,
+    cache_path: Path = CACHE_PATH,
+    debounce: float = WATCH_DEBOUNCE,
+    interval: float = WATCH_INTERVAL,
+    jobs: int = DEFAULT_JOBS,
+) -> None:
+    """Regenerate changed sections until interrupted.
+
+    A section is rebuilt once writes to it have been quiet for ``debounce``
+    seconds; changes come from watchdog when installed, else from polling.
+    """
+    batcher = ChangeBatcher(debounce)
+    stop = threading.Event()
+    stop_watcher = start_watcher(content_root, batcher, interval)
+    try:
+        while not stop.is_set():
+            batch = batcher.wait(stop)
+            for section, events in sorted(batch.items()):
+                started = time.perf_counter()
+                try:
+                    update_section(section, content_root=content_root, cache=cache, jobs=jobs)
+                    save_cache(cache_path, cache)
+                    if section == EVENTS_SECTION:
+                        refresh_event_splits(content_root)
+                    write_version_file(content_root)
+                except (OSError, ValueError) as exc:
+                    # Keep watching; the next change to the section retries.
+                    print(f"[watch] {section}: regeneration failed: {exc}")
+                    continue
+                elapsed = time.perf_counter() - started
+                print(f"[watch] {section}: regenerated in {elapsed:.3f}s after {events} event(s).")
+    except KeyboardInterrupt:
+        print("\n[watch] Stopped.")
+    finally:
+        stop.set()
+        stop_watcher()
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate content manifests.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the parse cache and rescan every content file",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Worker processes for reading content files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        default=None,
+        help=f"Date that splits upcoming from past events (default: today in {EVENTS_TIMEZONE})",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate sections as their content changes",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=WATCH_DEBOUNCE,
+        help=f"Seconds of quiet before a watched section is rebuilt (default: {WATCH_DEBOUNCE})",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=WATCH_INTERVAL,
+        help=f"Polling interval without watchdog (default: {WATCH_INTERVAL})",
+    )
+    args = parser.parse_args()
+
+    cache = load_cache(CACHE_PATH)
     for section in SECTION_SETTINGS:
-        update_section(section)
+        update_section(section, cache=cache, full=args.full, jobs=args.jobs)
+    save_cache(CACHE_PATH, cache)
+    refresh_event_splits(today=args.today)
+    write_version_file()
+    if args.watch:
+        watch(cache, debounce=args.debounce, interval=args.interval, jobs=args.jobs)
 
 
 if __name__ == "__main__":
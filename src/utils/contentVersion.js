@@ -0,0 +1,35 @@
+import { withBase } from './paths.js'
+
+let versionPromise = null
+
+/**
+ * Load `content/version.json`, which maps each section to its fingerprinted
+ * manifest (`index.<hash>.json`). It is the only content file served with a
+ * short TTL, so it is revalidated on every page load and fetched once.
+ */
+function loadContentVersion() {
+  if (!versionPromise) {
+    versionPromise = fetch(withBase('content/version.json'), { cache: 'no-cache' })
+      .then((res) => (res.ok ? res.json() : {}))
+      .catch(() => ({}))
+  }
+  return versionPromise
+}
+
+/**
+ * URL of a section's manifest: the immutable hashed copy when the pointer
+ * file lists one, otherwise the plain `index.json`. The dev server always
+ * uses `index.json`, since the post wizard edits it without re-hashing.
+ *
+ * @param {string} section - Content directory, e.g. 'news' or 'dtcc-1'
+ * @returns {Promise<string>}
+ */
+export async function manifestUrl(section) {
+  if (import.meta.env.DEV) return withBase(`content/${section}/index.json`)
+  const version = await loadContentVersion()
+  const name = version?.sections?.[section]
+  if (typeof name === 'string' && /^index\.[0-9a-f]+\.json$/.test(name)) {
+    return withBase(`content/${section}/${name}`)
+  }
+  return withBase(`content/${section}/index.json`)
+}
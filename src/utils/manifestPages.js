@@ -0,0 +1,73 @@
+import { withBase } from './paths.js'
+import { manifestUrl } from './contentVersion.js'
+
+const manifestItems = (payload) =>
+  Array.isArray(payload?.items) ? payload.items : Array.isArray(payload) ? payload : []
+
+/**
+ * Read a section's manifest a page at a time, in display order.
+ *
+ * `index.pages.json` lists the `index.page-<n>.json` shards in display order
+ * (newest first for date-ordered sections), so list views fetch the head and
+ * only the pages they show. Without a head, and on the dev server (where the
+ * post wizard edits `index.json` without re-paging), the whole manifest is
+ * returned as a single page.
+ *
+ * @param {string} section - Content directory, e.g. 'news'
+ * @returns {Promise<{ total: number, pageSize: number, hasMore: () => boolean, next: () => Promise<object[]> }>}
+ */
+export async function openManifestPages(section) {
+  let head = null
+  if (!import.meta.env.DEV) {
+    try {
+      const res = await fetch(withBase(`content/${section}/index.pages.json`), { cache: 'default' })
+      if (res.ok) head = await res.json()
+    } catch (_) { /* fall back to the full manifest */ }
+  }
+
+  if (!head || !Array.isArray(head.pages)) {
+    const res = await fetch(await manifestUrl(section), { cache: 'default' })
+    const items = res.ok ? manifestItems(await res.json()) : []
+    let read = false
+    return {
+      total: items.length,
+      pageSize: items.length,
+      hasMore: () => !read,
+      next: async () => {
+        if (read) return []
+        read = true
+        return items
+      },
+    }
+  }
+
+  const pages = head.pages.filter((page) => typeof page?.file === 'string' && /^index\.page-\d+\.json$/.test(page.file))
+  let position = 0
+  return {
+    total: Number(head.total) || 0,
+    pageSize: Number(head.pageSize) || 0,
+    hasMore: () => position < pages.length,
+    next: async () => {
+      if (position >= pages.length) return []
+      const { file } = pages[position++]
+      const res = await fetch(withBase(`content/${section}/${file}`), { cache: 'default' })
+      return res.ok ? manifestItems(await res.json()) : []
+    },
+  }
+}
+
+/**
+ * The first `count` manifest entries in display order, fetching only as many
+ * pages as that takes: usually the newest page, plus the one before it when
+ * the newest is not yet full.
+ *
+ * @param {string} section - Content directory, e.g. 'news'
+ * @param {number} [count] - Entries wanted; defaults to one page
+ */
+export async function loadLatestEntries(section, count) {
+  const pages = await openManifestPages(section)
+  const wanted = count || pages.pageSize
+  const items = []
+  while (items.length < wanted && pages.hasMore()) items.push(...(await pages.next()))
+  return items.slice(0, wanted)
+}
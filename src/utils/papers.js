@@ -0,0 +1,79 @@
+import { resolveUrl } from './paths.js'
+
+const PAPER_FIELDS = [
+  'id', 'doi', 'title', 'author_name', 'journal', 'date', 'url', 'publication_type', 'additional_authors',
+]
+
+let storePromise = null
+
+/**
+ * Decode `papers/store.json` into a `{ key: paper }` map. Handles both the
+ * keyed row layout and the columnar layout written with `--columnar`.
+ */
+export function decodePaperStore(payload) {
+  if (!payload || typeof payload !== 'object') return {}
+  if (payload.layout === 'columns') {
+    const keys = Array.isArray(payload.keys) ? payload.keys : []
+    const columns = payload.columns || {}
+    const map = {}
+    keys.forEach((key, row) => {
+      const paper = {}
+      for (const field of PAPER_FIELDS) paper[field] = Array.isArray(columns[field]) ? columns[field][row] : null
+      map[key] = paper
+    })
+    return map
+  }
+  return payload.papers && typeof payload.papers === 'object' ? payload.papers : {}
+}
+
+/** Fetch the shared paper store once per page. */
+export function loadPaperStore() {
+  if (!storePromise) {
+    storePromise = fetch(resolveUrl('content/papers/store.json'), { cache: 'default' })
+      .then((res) => (res.ok ? res.json() : null))
+      .then(decodePaperStore)
+      .catch(() => ({}))
+  }
+  return storePromise
+}
+
+/**
+ * Ordered papers of one milestone. Milestone files list paper `ids` into
+ * the store; files from before the store still carry inline `papers`.
+ */
+export async function loadMilestonePapers(slug) {
+  const res = await fetch(resolveUrl(`content/papers/${slug}.json`), { cache: 'default' })
+  if (!res.ok) return []
+  const payload = await res.json()
+  if (Array.isArray(payload.papers)) return payload.papers
+  if (!Array.isArray(payload.ids)) return []
+  const store = await loadPaperStore()
+  return payload.ids.map((key) => store[key]).filter(Boolean)
+}
+
+/** Fetch `papers/facets.json`: `{ count, ids, facets: { facet: { value: { count, ids, label? } } } }`. */
+export async function loadPaperFacets() {
+  const res = await fetch(resolveUrl('content/papers/facets.json'), { cache: 'default' })
+  if (!res.ok) return null
+  return res.json()
+}
+
+/**
+ * Ids matching a filter such as `{ year: ['2024', '2023'], author: ['anders logg'] }`:
+ * values of one facet are OR-ed, facets are AND-ed. Returns every id when
+ * nothing is selected; ids are in store order (newest first).
+ */
+export function filterPaperIds(facets, selection) {
+  const sets = []
+  for (const [facet, values] of Object.entries(selection || {})) {
+    if (!Array.isArray(values) || !values.length) continue
+    const index = facets?.facets?.[facet] || {}
+    sets.push(new Set(values.flatMap((value) => index[value]?.ids || [])))
+  }
+  sets.sort((a, b) => a.size - b.size)
+  const all = facets?.ids || []
+  if (!sets.length) return all
+  const [smallest, ...rest] = sets
+  const matched = new Set([...smallest].filter((id) => rest.every((set) => set.has(id))))
+  return all.filter((id) => matched.has(id))
+}
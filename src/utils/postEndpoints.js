@@ -5,6 +5,7 @@ const ENV = {
   VITE_POST_PUBLISH_URL: import.meta.env.VITE_POST_PUBLISH_URL,
   VITE_CHAT_AUTH_URL: import.meta.env.VITE_CHAT_AUTH_URL,
   VITE_CHAT_PUBLISH_URL: import.meta.env.VITE_CHAT_PUBLISH_URL,
+  VITE_CONTENT_API_URL: import.meta.env.VITE_CONTENT_API_URL,
 }
 
 function sanitizeEndpoint(value) {
@@ -73,3 +74,11 @@ export function resolvePostEndpoints() {
     publishMisconfigured,
   }
 }
+
+/**
+ * Base URL of the content API served by `news_item_wizard.py --serve`
+ * (`VITE_CONTENT_API_URL`), without a trailing slash; '' when unset.
+ */
+export function resolveContentApi() {
+  return pickEnvValue('VITE_CONTENT_API_URL').replace(/\/+$/, '')
+}
@@ -0,0 +1,51 @@
+import { resolveUrl } from './paths.js'
+
+/**
+ * Fetch the build-time companion of a detail item
+ * (`content/<section>/resolved/<slug>.json`): the item itself plus card
+ * summaries of the items it references, its contact users and, for dtcc-1,
+ * its papers. Returns null when the file is missing, e.g. on the dev server,
+ * where the post wizard edits items without rebuilding companions.
+ *
+ * @param {string} section - Content directory, e.g. 'news' or 'dtcc-1'
+ * @param {string} slug
+ * @returns {Promise<object|null>}
+ */
+export async function fetchResolved(section, slug) {
+  if (import.meta.env.DEV) return null
+  try {
+    const res = await fetch(resolveUrl(`content/${section}/resolved/${slug}.json`), { cache: 'default' })
+    if (!res.ok) return null
+    const payload = await res.json()
+    return payload && typeof payload.item === 'object' ? payload : null
+  } catch (_) {
+    return null
+  }
+}
+
+/**
+ * Load a referenced item: its card from `resolved` when given (null when the
+ * build found no such item), otherwise the full item JSON.
+ */
+export async function loadReference(resolved, section, refSlug) {
+  if (resolved) return resolved.refs?.[section]?.[refSlug] || null
+  try {
+    const res = await fetch(resolveUrl(`content/${section}/${refSlug}.json`), { cache: 'default' })
+    if (!res.ok) return null
+    return await res.json()
+  } catch (_) {
+    return null
+  }
+}
+
+/** Map user records by slug (or id, username, email), as `users.json` is keyed. */
+export function indexUsers(items) {
+  const map = {}
+  for (const entry of Array.isArray(items) ? items : []) {
+    if (!entry) continue
+    const key = entry.slug || entry.id || entry.username || entry.email
+    if (!key) continue
+    map[key] = entry
+  }
+  return map
+}
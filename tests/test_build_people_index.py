@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from build_people_index import PersonMatcher  # noqa: E402
+
+
+USERS = {
+    "anders-logg": {"name": "Anders Logg"},
+    "liane-thuvander": {"name": "Liane Thuvander"},
+}
+
+
+def test_person_matcher_initials():
+    matcher = PersonMatcher(USERS)
+    assert matcher.match("anders-logg") == "anders-logg"
+    assert matcher.match("Logg, Anders") == "anders-logg"
+    assert matcher.match("A. Logg") == "anders-logg"
+    assert matcher.match("A Logg") == "anders-logg"
+    assert matcher.match("L Thuvander") == "liane-thuvander"
+
+
+def test_person_matcher_rejects_other_given_names():
+    matcher = PersonMatcher(USERS)
+    assert matcher.match("Anna Logg") is None
+    assert matcher.match("Logg, Anna") is None
+    assert matcher.match("B. Logg") is None
+    assert matcher.match("...") is None
@@ -0,0 +1,135 @@
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import news_item_wizard as wizard  # noqa: E402
+
+
+PROCESSES = 8
+SAVES_PER_PROCESS = 25
+
+
+def _save_many(manifest_path: str, worker: int) -> None:
+    path = Path(manifest_path)
+    for n in range(SAVES_PER_PROCESS):
+        slug = f"item-{worker}-{n}"
+        wizard.update_manifest(path, slug, f"content/news/{slug}.webp", quiet=True)
+        # Every worker also races on one shared slug, which must appear once.
+        wizard.update_manifest(path, "shared", None, quiet=True)
+
+
+def _read_slugs(manifest_path: Path) -> list:
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    return [entry["base"] for entry in manifest["items"]]
+
+
+def test_update_manifest_skips_existing_slug(tmp_path):
+    manifest_path = tmp_path / "index.json"
+    manifest_path.write_text(json.dumps({"items": ["legacy", {"base": "kept"}]}), encoding="utf-8")
+
+    assert wizard.update_manifest(manifest_path, "kept", None, quiet=True) is False
+    assert wizard.update_manifest(manifest_path, "legacy", None, quiet=True) is False
+    assert wizard.update_manifest(manifest_path, "fresh", "img.webp", quiet=True) is True
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert manifest["items"][-1] == {"base": "fresh", "image": "img.webp"}
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def test_atomic_write_json_keeps_file_mode(tmp_path):
+    fresh = tmp_path / "fresh.json"
+    wizard.atomic_write_json(fresh, {"a": 1})
+    assert fresh.stat().st_mode & 0o777 == wizard.NEW_FILE_MODE
+    assert wizard.NEW_FILE_MODE == 0o666 & ~_umask()
+
+    existing = tmp_path / "existing.json"
+    existing.write_text("{}", encoding="utf-8")
+    existing.chmod(0o664)
+    wizard.atomic_write_json(existing, {"a": 2})
+    assert existing.stat().st_mode & 0o777 == 0o664
+    assert json.loads(existing.read_text(encoding="utf-8")) == {"a": 2}
+
+
+def test_manifest_store_sees_external_edits(tmp_path):
+    manifest_path = tmp_path / "index.json"
+    store = wizard.ManifestStore(manifest_path)
+    assert store.add("first", None) is True
+
+    manifest_path.write_text(json.dumps({"items": [{"base": "edited-by-hand"}]}), encoding="utf-8")
+
+    assert store.contains("edited-by-hand")
+    assert not store.contains("first")
+
+
+def test_parallel_savers_across_processes(tmp_path):
+    manifest_path = tmp_path / "index.json"
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(target=_save_many, args=(str(manifest_path), worker))
+        for worker in range(PROCESSES)
+    ]
+    for proc in workers:
+        proc.start()
+    for proc in workers:
+        proc.join(timeout=120)
+        assert proc.exitcode == 0
+
+    slugs = _read_slugs(manifest_path)
+    expected = {f"item-{w}-{n}" for w in range(PROCESSES) for n in range(SAVES_PER_PROCESS)}
+    assert len(slugs) == len(set(slugs))
+    assert set(slugs) == expected | {"shared"}
+    assert not list(tmp_path.glob(".index.json.*.tmp"))
+
+
+def test_parallel_savers_across_threads(tmp_path):
+    manifest_path = tmp_path / "index.json"
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(
+            pool.map(
+                lambda n: wizard.update_manifest(manifest_path, f"t-{n % 50}", None, quiet=True),
+                range(400),
+            )
+        )
+
+    assert sum(results) == 50
+    assert sorted(_read_slugs(manifest_path)) == sorted(f"t-{n}" for n in range(50))
+
+
+def _write_entry(section_dir: Path, slug: str, title: str, date: str) -> Path:
+    path = section_dir / f"{slug}.json"
+    path.write_text(json.dumps({"title": title, "date": date}), encoding="utf-8")
+    return path
+
+
+def test_content_index_pages_search_and_refresh(tmp_path):
+    news_dir = tmp_path / "news"
+    news_dir.mkdir()
+    (news_dir / "index.json").write_text('{"items": []}', encoding="utf-8")
+    _write_entry(news_dir, "older", "Urban trees in focus", "2024-01-01")
+    _write_entry(news_dir, "newer", "Twin workshop", "2025-06-01")
+
+    index = wizard.ContentIndex(tmp_path, sections=("news",))
+    first = index.page("news", 1, 1)
+    assert first["total"] == 2
+    assert [item["slug"] for item in first["items"]] == ["newer"]
+    assert [item["slug"] for item in index.search("news", "urb", 10)] == ["older"]
+
+    etag = index.etag("news")
+    added = _write_entry(news_dir, "latest", "Urban resilience panel", "2026-01-01")
+    index.refresh_path(added)
+    assert index.etag("news") != etag
+    assert [item["slug"] for item in index.search("news", "urban", 10)] == ["latest", "older"]
+
+    (news_dir / "older.json").unlink()
+    assert index.rescan("news") is True
+    assert index.get("news", "older") is None
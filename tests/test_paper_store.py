@@ -0,0 +1,33 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import paper_store  # noqa: E402
+
+
+PAPER = {"id": 1, "doi": "10.1/x", "title": "Paper", "date": "2024-01-01"}
+
+
+def test_write_layout_skips_reserved_milestone_slugs(tmp_path):
+    key = paper_store.paper_key(PAPER)
+    records = {key: paper_store.paper_record(PAPER)}
+    milestones = [
+        {"name": "Store", "slug": "store", "ids": [key]},
+        {"name": "Index", "slug": "index", "ids": [key]},
+        {"name": "Facets", "slug": "facets", "ids": [key]},
+        {"name": "Twins", "slug": "twins", "ids": [key]},
+    ]
+    paper_store.write_layout(tmp_path, milestones, records)
+
+    store = json.loads((tmp_path / "store.json").read_text(encoding="utf-8"))
+    index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+    facets = json.loads((tmp_path / "facets.json").read_text(encoding="utf-8"))
+    assert store["layout"] == "rows" and list(store["papers"]) == [key]
+    assert [m["slug"] for m in index["milestones"]] == ["twins"]
+    assert facets["ids"] == [key]
+
+    records, loaded = paper_store.load_papers(tmp_path)
+    assert [m["slug"] for m in loaded] == ["twins"]
+    assert list(records) == [key]
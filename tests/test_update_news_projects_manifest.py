@@ -0,0 +1,32 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import update_news_projects_manifest as manifest  # noqa: E402
+
+
+def _titles(content_root: Path) -> dict:
+    payload = json.loads((content_root / "news" / "index.json").read_text(encoding="utf-8"))
+    return {entry["base"]: entry.get("title") for entry in payload["items"]}
+
+
+def test_update_section_survives_half_written_files(tmp_path):
+    news = tmp_path / "news"
+    news.mkdir()
+    (news / "first.json").write_text(json.dumps({"title": "First", "date": "2024-01-01"}), encoding="utf-8")
+    cache = {"version": manifest.CACHE_VERSION, "sections": {}}
+    manifest.update_section("news", content_root=tmp_path, cache=cache)
+    assert _titles(tmp_path) == {"first": "First"}
+
+    # A new file and an edited one, both saved halfway.
+    (news / "second.json").write_text('{"title": "Second",', encoding="utf-8")
+    (news / "first.json").write_text('{"title": "Fir', encoding="utf-8")
+    manifest.update_section("news", content_root=tmp_path, cache=cache)
+    assert _titles(tmp_path) == {"first": "First"}
+
+    (news / "second.json").write_text(json.dumps({"title": "Second", "date": "2024-02-01"}), encoding="utf-8")
+    (news / "first.json").write_text(json.dumps({"title": "First!", "date": "2024-01-01"}), encoding="utf-8")
+    manifest.update_section("news", content_root=tmp_path, cache=cache)
+    assert _titles(tmp_path) == {"second": "Second", "first": "First!"}